@@ -1,20 +1,151 @@
+import asyncio
+import atexit
+import contextlib
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, NamedTuple
+
+import httpx
 from openai import AsyncOpenAI
 from config.settings import settings
 from models.prompt_settings import get_prompt_profile
 
+try:
+    import diskcache
+except ImportError:  # 선택 의존성: 없으면 프로세스 내 캐시만 사용
+    diskcache = None
+
+try:
+    import h2  # noqa: F401 - httpx의 HTTP/2 지원 여부 확인용
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DEFAULT_MODEL = "gpt-4o"
+RESPONSE_CACHE_MAX_ENTRIES = 256
+# 큰 SRT의 비스트리밍 JSON 생성은 수 분이 걸릴 수 있으므로 SDK 기본값(600초)을 유지하고 연결만 빨리 포기한다.
+OPENAI_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_SEC = 30.0
+BATCH_FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
 _client: AsyncOpenAI | None = None
+_http_client: httpx.AsyncClient | None = None
+_response_cache: OrderedDict[str, str] = OrderedDict()
+_response_cache_lock = asyncio.Lock()
+_inflight: dict[str, asyncio.Task] = {}
+_OPENAI_SEM = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")))
+_disk_cache = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+            timeout=OPENAI_TIMEOUT,
+        )
+    return _http_client
 
 
 def _get_client() -> AsyncOpenAI:
     global _client
     if _client is None:
-        _client = AsyncOpenAI(api_key=settings.openai_api_key)
+        _client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=_get_http_client(),
+            timeout=OPENAI_TIMEOUT,
+        )
     return _client
 
 
+async def close_client() -> None:
+    """Close the shared HTTP connection pool. web.main's lifespan calls this on shutdown."""
+    global _client, _http_client
+    http_client = _http_client
+    _client = None
+    _http_client = None
+    if http_client is not None and not http_client.is_closed:
+        await http_client.aclose()
+
+
+def _close_client_at_exit() -> None:
+    # 웹 앱은 lifespan 종료에서 먼저 닫는다. 종료 훅이 없는 CLI 실행에서만 남은 연결 풀을 정리한다.
+    if _http_client is None or _http_client.is_closed:
+        return
+    with contextlib.suppress(Exception):
+        asyncio.run(close_client())
+
+
+atexit.register(_close_client_at_exit)
+
+
+def _get_disk_cache():
+    global _disk_cache
+    if _disk_cache is None and diskcache is not None:
+        _disk_cache = diskcache.Cache(str(DATA_DIR / "openai_cache"))
+    return _disk_cache
+
+
+def _build_messages(system_prompt: str, user_prompt: str, style_directive: str = "") -> list[dict[str, str]]:
+    # 프로필별 스타일 지시는 별도 메시지로 분리해 공통 system 프롬프트 prefix를 유지한다.
+    messages = [{"role": "system", "content": system_prompt}]
+    if style_directive:
+        messages.append({"role": "system", "content": style_directive})
+    messages.append({"role": "user", "content": user_prompt})
+    return messages
+
+
+def _cache_key(model: str, temperature: float, messages: list[dict[str, str]]) -> str:
+    payload = json.dumps(
+        {"model": model, "temp": temperature, "messages": messages},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+
+async def _cache_get(key: str) -> str | None:
+    async with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _response_cache.move_to_end(key)
+            return cached
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        cached = await asyncio.to_thread(disk_cache.get, key)
+        if cached is not None:
+            await _cache_put_memory(key, cached)
+            return cached
+    return None
+
+
+async def _cache_put_memory(key: str, value: str) -> None:
+    async with _response_cache_lock:
+        _response_cache[key] = value
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+
+async def _cache_put(key: str, value: str) -> None:
+    await _cache_put_memory(key, value)
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        await asyncio.to_thread(disk_cache.set, key, value)
+
+
 YOUTUBE_SYSTEM_PROMPT = "너는 유튜브 자막을 정리해서 작성하는 도우미야."
 
-YOUTUBE_USER_PROMPT = """아래 유튜브 자막(SRT)을 분석해서 다음 JSON 형식으로 정리해줘.
+# 프롬프트 캐시 적중을 위해 불변 지시문/스키마를 앞에, 가변 본문은 항상 맨 끝에 둔다.
+YOUTUBE_SCHEMA_BLOCK = """아래 유튜브 자막(SRT)을 분석해서 다음 JSON 형식으로 정리해줘.
 
 - videoTitle: SEO 최적화된 제목 (25자 이내)
 - tags: 5~10개 키워드 (띄어쓰기 없이, 쉼표 구분)
@@ -29,14 +160,13 @@ YOUTUBE_USER_PROMPT = """아래 유튜브 자막(SRT)을 분석해서 다음 JSO
   - shorts: 2~3문장 Shorts 스크립트 (캐주얼)
   - screenshotTimestamp: "hh:mm:ss" (썸네일 프레임)
 
-순수 JSON만 출력해. 코드 블록이나 설명 없이.
+순수 JSON만 출력해. 코드 블록이나 설명 없이."""
 
-자막:
-{srt_text}"""
+YOUTUBE_USER_PROMPT = YOUTUBE_SCHEMA_BLOCK + "\n\n자막:\n{srt_text}"
 
 NEWS_SYSTEM_PROMPT = "너는 유튜브 자막을 정리해서 작성하는 도우미야."
 
-NEWS_USER_PROMPT = """아래 텍스트를 분석해서 다음 JSON 형식으로 정리해줘.
+NEWS_SCHEMA_BLOCK = """아래 텍스트를 분석해서 다음 JSON 형식으로 정리해줘.
 
 - videoTitle: 핵심 주제 1줄 (25자 이내, 이모지 포함)
 - tags: 5~10개 키워드 (띄어쓰기 없이, 쉼표 구분)
@@ -51,101 +181,364 @@ NEWS_USER_PROMPT = """아래 텍스트를 분석해서 다음 JSON 형식으로
   - shorts: 2~3문장 Shorts 스크립트 (캐주얼)
   - screenshotTimestamp: "00:00:00"
 
-순수 JSON만 출력해. 코드 블록이나 설명 없이.
+순수 JSON만 출력해. 코드 블록이나 설명 없이."""
 
-텍스트:
-{text}"""
+NEWS_USER_PROMPT = NEWS_SCHEMA_BLOCK + "\n\n텍스트:\n{text}"
 
 THREADS_SYSTEM_PROMPT = "너는 Threads에 올릴 짧은 스토리형 포스트를 작성하는 도우미야."
 
-THREADS_USER_PROMPT = """아래 내용을 Threads 포스트로 다시 써줘.
+THREADS_SCHEMA_BLOCK = """아래 내용을 Threads 포스트로 다시 써줘.
 - 대화하듯 친근한 톤
 - 짧은 문장, 줄바꿈 활용
 - 이모지, 구어체 OK
-- 반드시 450자 이내
+- 반드시 450자 이내"""
+
+THREADS_USER_PROMPT = THREADS_SCHEMA_BLOCK + "\n\n내용:\n{text}"
+
+
+def _canonicalize(text: str) -> str:
+    """Normalize line endings and outer whitespace so identical prompts stay byte-identical."""
+    return str(text or "").replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+class CompiledPrompt(NamedTuple):
+    system_prompt: str
+    style_directive: str
+    template_parts: tuple[str, ...]
+
+    def render(self, text: str) -> str:
+        # str.replace(placeholder, text)와 같은 결과를 미리 쪼개 둔 조각의 join 한 번으로 만든다.
+        return text.join(self.template_parts)
+
+
+@lru_cache(maxsize=32)
+def _compile_prompt(
+    system_prompt: str,
+    user_template: str,
+    placeholder: str,
+    tone: str,
+    language: str,
+    audience: str,
+) -> CompiledPrompt:
+    return CompiledPrompt(
+        system_prompt=_canonicalize(system_prompt),
+        style_directive=f"톤: {tone}. 출력 언어: {language}. 타깃 독자층: {audience}.",
+        template_parts=tuple(_canonicalize(user_template).split(placeholder)),
+    )
 
-내용:
-{text}"""
+
+def _get_compiled_prompt(
+    profile_name: str,
+    default_system: str,
+    default_template: str,
+    placeholder: str,
+    default_tone: str,
+    default_audience: str,
+) -> CompiledPrompt:
+    """프로필 값 자체를 캐시 키로 써서, 프로필이 바뀌면 자동으로 다시 컴파일된다."""
+    profile = get_prompt_profile(profile_name)
+    return _compile_prompt(
+        str(profile.get("system_prompt") or default_system),
+        str(profile.get("user_prompt_template") or default_template),
+        placeholder,
+        str(profile.get("tone", default_tone)),
+        str(profile.get("language", "ko")),
+        str(profile.get("audience", default_audience)),
+    )
 
 
 async def generate_youtube_content(srt_text: str) -> str:
     """Generate structured content from YouTube SRT subtitles."""
-    client = _get_client()
-    profile = get_prompt_profile("youtube")
-    user_template = profile.get("user_prompt_template") or YOUTUBE_USER_PROMPT
-    prompt = user_template.replace("{srt_text}", srt_text)
-    tone = profile.get("tone", "professional")
-    language = profile.get("language", "ko")
-    audience = profile.get("audience", "일반 대중")
-    style_directive = f"톤: {tone}. 출력 언어: {language}. 타깃 독자층: {audience}."
-    system_prompt = (profile.get("system_prompt") or YOUTUBE_SYSTEM_PROMPT).strip()
-    system_prompt = f"{system_prompt}\n\n{style_directive}"
-    resp = await client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt},
-        ],
+    compiled = _get_compiled_prompt(
+        "youtube", YOUTUBE_SYSTEM_PROMPT, YOUTUBE_USER_PROMPT, "{srt_text}", "professional", "일반 대중"
+    )
+    return await call_chatgpt(
+        compiled.system_prompt,
+        compiled.render(srt_text),
         temperature=0.7,
+        style_directive=compiled.style_directive,
+        prompt_cache_key="youtube",
     )
-    return resp.choices[0].message.content or ""
 
 
 async def generate_news_content(text: str) -> str:
     """Generate structured content from raw text/notes."""
-    client = _get_client()
-    profile = get_prompt_profile("news_text")
-    user_template = profile.get("user_prompt_template") or NEWS_USER_PROMPT
-    prompt = user_template.replace("{text}", text)
-    tone = profile.get("tone", "professional")
-    language = profile.get("language", "ko")
-    audience = profile.get("audience", "실무자")
-    style_directive = f"톤: {tone}. 출력 언어: {language}. 타깃 독자층: {audience}."
-    system_prompt = (profile.get("system_prompt") or NEWS_SYSTEM_PROMPT).strip()
-    system_prompt = f"{system_prompt}\n\n{style_directive}"
-    resp = await client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt},
-        ],
+    compiled = _get_compiled_prompt(
+        "news_text", NEWS_SYSTEM_PROMPT, NEWS_USER_PROMPT, "{text}", "professional", "실무자"
+    )
+    return await call_chatgpt(
+        compiled.system_prompt,
+        compiled.render(text),
         temperature=0.7,
+        style_directive=compiled.style_directive,
+        prompt_cache_key="news_text",
     )
-    return resp.choices[0].message.content or ""
 
 
 async def generate_threads_post(text: str) -> str:
     """Generate a Threads-style short post (max 450 chars)."""
-    client = _get_client()
-    profile = get_prompt_profile("threads")
-    user_template = profile.get("user_prompt_template") or THREADS_USER_PROMPT
-    prompt = user_template.replace("{text}", text)
-    tone = profile.get("tone", "casual")
-    language = profile.get("language", "ko")
-    audience = profile.get("audience", "SNS 사용자")
-    style_directive = f"톤: {tone}. 출력 언어: {language}. 타깃 독자층: {audience}."
-    system_prompt = (profile.get("system_prompt") or THREADS_SYSTEM_PROMPT).strip()
-    system_prompt = f"{system_prompt}\n\n{style_directive}"
-    resp = await client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt},
-        ],
+    compiled = _get_compiled_prompt(
+        "threads", THREADS_SYSTEM_PROMPT, THREADS_USER_PROMPT, "{text}", "casual", "SNS 사용자"
+    )
+    return await call_chatgpt(
+        compiled.system_prompt,
+        compiled.render(text),
         temperature=0.8,
+        style_directive=compiled.style_directive,
+        prompt_cache_key="threads",
     )
-    return resp.choices[0].message.content or ""
 
 
-async def call_chatgpt(system_prompt: str, user_prompt: str) -> str:
-    """Generic ChatGPT call."""
-    client = _get_client()
-    resp = await client.chat.completions.create(
-        model="gpt-4o",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
+async def stream_youtube_content(srt_text: str) -> AsyncIterator[str]:
+    """Streaming variant of generate_youtube_content; yields content deltas."""
+    compiled = _get_compiled_prompt(
+        "youtube", YOUTUBE_SYSTEM_PROMPT, YOUTUBE_USER_PROMPT, "{srt_text}", "professional", "일반 대중"
+    )
+    async for delta in stream_chatgpt(
+        compiled.system_prompt,
+        compiled.render(srt_text),
+        temperature=0.7,
+        style_directive=compiled.style_directive,
+        prompt_cache_key="youtube",
+    ):
+        yield delta
+
+
+async def stream_news_content(text: str) -> AsyncIterator[str]:
+    """Streaming variant of generate_news_content; yields content deltas."""
+    compiled = _get_compiled_prompt(
+        "news_text", NEWS_SYSTEM_PROMPT, NEWS_USER_PROMPT, "{text}", "professional", "실무자"
+    )
+    async for delta in stream_chatgpt(
+        compiled.system_prompt,
+        compiled.render(text),
         temperature=0.7,
+        style_directive=compiled.style_directive,
+        prompt_cache_key="news_text",
+    ):
+        yield delta
+
+
+async def stream_threads_post(text: str) -> AsyncIterator[str]:
+    """Streaming variant of generate_threads_post; yields content deltas."""
+    compiled = _get_compiled_prompt(
+        "threads", THREADS_SYSTEM_PROMPT, THREADS_USER_PROMPT, "{text}", "casual", "SNS 사용자"
     )
+    async for delta in stream_chatgpt(
+        compiled.system_prompt,
+        compiled.render(text),
+        temperature=0.8,
+        style_directive=compiled.style_directive,
+        prompt_cache_key="threads",
+    ):
+        yield delta
+
+
+async def collect(chunks: AsyncIterator[str]) -> str:
+    """Join a streamed response into a single string."""
+    return "".join([chunk async for chunk in chunks])
+
+
+async def generate_all(srt_text: str, text: str) -> dict[str, str]:
+    """Generate YouTube, news and Threads outputs concurrently."""
+    youtube, news, threads = await asyncio.gather(
+        generate_youtube_content(srt_text),
+        generate_news_content(text),
+        generate_threads_post(text),
+    )
+    return {"youtube": youtube, "news": news, "threads": threads}
+
+
+async def call_chatgpt(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7,
+    style_directive: str = "",
+    prompt_cache_key: str | None = None,
+) -> str:
+    """Generic ChatGPT call.
+
+    Identical requests are served from the response cache, and concurrent
+    duplicates share a single in-flight API call.
+    """
+    messages = _build_messages(system_prompt, user_prompt, style_directive)
+    key = _cache_key(DEFAULT_MODEL, temperature, messages)
+    cached = await _cache_get(key)
+    if cached is not None:
+        return cached
+
+    # 같은 요청은 하나의 공유 태스크로 실행하고, 모든 호출자는 shield로 기다린다.
+    # 한 호출자가 취소(클라이언트 연결 끊김 등)되어도 공유 태스크와 다른 대기자에게는 전파되지 않는다.
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_shared_completion(key, messages, temperature, prompt_cache_key))
+        _inflight[key] = task
+        task.add_done_callback(lambda done, key=key: _finish_inflight(key, done))
+    return await asyncio.shield(task)
+
+
+async def _shared_completion(
+    key: str,
+    messages: list[dict[str, str]],
+    temperature: float,
+    prompt_cache_key: str | None,
+) -> str:
+    content = await _request_completion(messages, temperature, prompt_cache_key)
+    if content:
+        await _cache_put(key, content)
+    return content
+
+
+def _finish_inflight(key: str, task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()  # 대기자가 모두 떠났어도 "never retrieved" 경고가 나지 않도록 소비
+
+
+async def _request_completion(
+    messages: list[dict[str, str]],
+    temperature: float,
+    prompt_cache_key: str | None,
+) -> str:
+    client = _get_client()
+    async with _OPENAI_SEM:
+        resp = await client.chat.completions.create(
+            model=DEFAULT_MODEL,
+            messages=messages,
+            temperature=temperature,
+            extra_body={"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None,
+        )
     return resp.choices[0].message.content or ""
+
+
+async def stream_chatgpt(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7,
+    style_directive: str = "",
+    prompt_cache_key: str | None = None,
+) -> AsyncIterator[str]:
+    """Streaming ChatGPT call. Yields content deltas as they arrive.
+
+    A cached response is yielded in one piece; a completed stream is stored
+    in the same response cache used by call_chatgpt.
+    """
+    messages = _build_messages(system_prompt, user_prompt, style_directive)
+    key = _cache_key(DEFAULT_MODEL, temperature, messages)
+    cached = await _cache_get(key)
+    if cached is not None:
+        yield cached
+        return
+
+    client = _get_client()
+    parts: list[str] = []
+    # 세마포어는 create()와 청크를 읽는 동안만 잡고 yield 중에는 놓아, 느리거나 중단된 SSE 소비자가
+    # 비스트리밍 호출의 동시 실행 슬롯을 붙잡고 있지 않게 한다.
+    async with _OPENAI_SEM:
+        stream = await client.chat.completions.create(
+            model=DEFAULT_MODEL,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
+            extra_body={"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None,
+        )
+    try:
+        chunks = aiter(stream)
+        while True:
+            async with _OPENAI_SEM:
+                chunk = await anext(chunks, None)
+            if chunk is None:
+                break
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            if delta:
+                parts.append(delta)
+                yield delta
+    finally:
+        await stream.close()
+    content = "".join(parts)
+    if content:
+        await _cache_put(key, content)
+
+
+async def submit_batch(jobs: list[tuple[str, str]], temperature: float = 0.7) -> str:
+    """Submit (system_prompt, user_prompt) jobs to the OpenAI Batch API and return the batch id.
+
+    For latency-insensitive backfills only; interactive calls stay on call_chatgpt.
+    Results are keyed by custom_id "job-<index>" in the order given.
+    """
+    if not jobs:
+        raise ValueError("배치 작업이 비어 있습니다.")
+    lines = []
+    for index, (system_prompt, user_prompt) in enumerate(jobs):
+        lines.append(
+            json.dumps(
+                {
+                    "custom_id": f"job-{index}",
+                    "method": "POST",
+                    "url": BATCH_ENDPOINT,
+                    "body": {
+                        "model": DEFAULT_MODEL,
+                        "messages": _build_messages(system_prompt, user_prompt),
+                        "temperature": temperature,
+                    },
+                },
+                ensure_ascii=False,
+            )
+        )
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+    client = _get_client()
+    input_file = await client.files.create(file=("batch.jsonl", payload), purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+    return batch.id
+
+
+class BatchResult(NamedTuple):
+    custom_id: str
+    content: str | None
+    error: str | None
+
+
+def _batch_row_result(row: dict) -> BatchResult:
+    # 출력 파일과 에러 파일의 행 형식이 같으므로 한 곳에서 성공/실패를 가른다.
+    custom_id = row.get("custom_id", "")
+    response = row.get("response") or {}
+    status_code = response.get("status_code")
+    if status_code == 200 and not row.get("error"):
+        choices = (response.get("body") or {}).get("choices") or []
+        content = (choices[0].get("message") or {}).get("content") if choices else ""
+        return BatchResult(custom_id, content or "", None)
+    error = row.get("error") or (response.get("body") or {}).get("error") or {}
+    message = error.get("message") if isinstance(error, dict) else str(error)
+    return BatchResult(custom_id, None, message or f"status_code={status_code}")
+
+
+async def poll_batch(batch_id: str, poll_interval_sec: float = BATCH_POLL_INTERVAL_SEC) -> AsyncIterator[BatchResult]:
+    """Wait for a batch to finish, then yield a BatchResult for every job.
+
+    Failed jobs (non-200 rows in the output file and all rows in the error file)
+    are yielded with content=None and the error message, so callers can retry them.
+    """
+    client = _get_client()
+    while True:
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            break
+        if batch.status in BATCH_FAILED_STATUSES:
+            raise RuntimeError(f"배치 처리 실패(status={batch.status}): {batch_id}")
+        await asyncio.sleep(poll_interval_sec)
+
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        output = await client.files.content(file_id)
+        for line in output.text.splitlines():
+            if line.strip():
+                yield _batch_row_result(json.loads(line))
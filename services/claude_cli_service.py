@@ -1,55 +1,78 @@
 import asyncio
+import codecs
+import contextlib
 import logging
+import os
 import shlex
 import subprocess
 import threading
 import time
 import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, NamedTuple
 
 from config.settings import settings
 
 logger = logging.getLogger("claude_cli")
 LOG_PREVIEW_LIMIT = 240
+STREAM_READ_CHUNK_BYTES = 65536
+STDIN_PIPE_BUFFER_BYTES = 65536
+_PRINT_FLAGS = frozenset({"-p", "--print"})
+_CLAUDE_SUBCOMMANDS = frozenset({
+    "agents",
+    "auth",
+    "doctor",
+    "install",
+    "mcp",
+    "plugin",
+    "setup-token",
+    "update",
+    "upgrade",
+})
+
+
+class SessionState(NamedTuple):
+    id: str
+    turns: int
+    last_used: float
+
+
+_EMPTY_SESSION = SessionState("", 0, 0.0)
+# 세션 상태는 불변 튜플 하나를 통째로 교체한다. 읽기는 락 없이 수행하고,
+# 교체(compare-and-set)만 짧게 _SESSION_STATE_LOCK으로 보호한다.
+_SESSION_STATE: list[SessionState] = [_EMPTY_SESSION]
 _SESSION_STATE_LOCK = threading.Lock()
-_SESSION_EXEC_LOCK = asyncio.Lock()
-_SESSION_STATE = {
-    "id": "",
-    "turns": 0,
-    "last_used": 0.0,
-}
+_SESSION_EXEC_LOCKS: dict[str, asyncio.Lock] = {}
+# 같은 세션은 위 락으로 직렬화하고, 전체 동시 실행 수는 세마포어로 제한한다.
+_CLAUDE_SEM = asyncio.Semaphore(max(1, int(getattr(settings, "claude_cli_max_parallel", 0) or 4)))
 
 
 def _shorten_for_log(text: str, limit: int = LOG_PREVIEW_LIMIT) -> str:
-    value = str(text or "").strip().replace("\n", "\\n")
-    if len(value) <= limit:
+    # 대용량 출력 전체를 훑지 않도록 앞부분만 잘라서 가공한다.
+    raw = str(text or "").lstrip()
+    value = raw[: limit + 32].rstrip().replace("\n", "\\n")
+    if len(value) <= limit and len(raw) <= limit + 32:
         return value
     return f"{value[:limit]}...(truncated)"
 
 
 def _resolve_command() -> list[str]:
-    command_text = (settings.claude_cli_command or "claude").strip()
+    return list(_resolve_command_cached(settings.claude_cli_command or "claude"))
+
+
+@lru_cache(maxsize=4)
+def _resolve_command_cached(command_text: str) -> tuple[str, ...]:
+    command_text = command_text.strip()
     command = shlex.split(command_text) if command_text else ["claude"]
     if not command:
-        return ["claude"]
+        return ("claude",)
     binary_name = Path(command[0]).name.lower()
-    has_print_flag = any(token in {"-p", "--print"} for token in command[1:])
-    claude_subcommands = {
-        "agents",
-        "auth",
-        "doctor",
-        "install",
-        "mcp",
-        "plugin",
-        "setup-token",
-        "update",
-        "upgrade",
-    }
-    has_subcommand = len(command) > 1 and command[1] in claude_subcommands
+    has_print_flag = any(token in _PRINT_FLAGS for token in command[1:])
+    has_subcommand = len(command) > 1 and command[1] in _CLAUDE_SUBCOMMANDS
     if binary_name == "claude" and not has_print_flag and not has_subcommand:
         command = [command[0], "-p", *command[1:]]
-    return command
+    return tuple(command)
 
 
 def _command_has_session_flags(command: list[str]) -> bool:
@@ -74,47 +97,65 @@ def _session_reuse_supported(command: list[str]) -> bool:
     return True
 
 
+def _compare_and_set_session(expected: SessionState, new: SessionState) -> bool:
+    with _SESSION_STATE_LOCK:
+        if _SESSION_STATE[0] is not expected:
+            return False
+        _SESSION_STATE[0] = new
+        return True
+
+
 def _lease_session_id() -> tuple[str, bool]:
-    now = time.monotonic()
     idle_limit = max(0, int(settings.claude_cli_session_idle_sec or 0))
     turn_limit = max(0, int(settings.claude_cli_session_max_turns or 0))
-    with _SESSION_STATE_LOCK:
-        current_id = str(_SESSION_STATE.get("id", "") or "")
-        current_turns = int(_SESSION_STATE.get("turns", 0) or 0)
-        last_used = float(_SESSION_STATE.get("last_used", 0.0) or 0.0)
-        idle_expired = bool(current_id and idle_limit > 0 and last_used > 0 and (now - last_used) >= idle_limit)
-        turn_expired = bool(current_id and turn_limit > 0 and current_turns >= turn_limit)
-        created = False
-        if not current_id or idle_expired or turn_expired:
-            current_id = str(uuid.uuid4())
-            _SESSION_STATE["id"] = current_id
-            _SESSION_STATE["turns"] = 0
-            _SESSION_STATE["last_used"] = now
-            created = True
-        return current_id, created
+    while True:
+        now = time.monotonic()
+        state = _SESSION_STATE[0]
+        idle_expired = bool(
+            state.id and idle_limit > 0 and state.last_used > 0 and (now - state.last_used) >= idle_limit
+        )
+        turn_expired = bool(state.id and turn_limit > 0 and state.turns >= turn_limit)
+        if state.id and not idle_expired and not turn_expired:
+            return state.id, False
+        rotated = SessionState(str(uuid.uuid4()), 0, now)
+        if _compare_and_set_session(state, rotated):
+            return rotated.id, True
 
 
 def _touch_session(session_id: str, success: bool) -> None:
     if not session_id:
         return
-    now = time.monotonic()
-    with _SESSION_STATE_LOCK:
-        if str(_SESSION_STATE.get("id", "") or "") != session_id:
+    while True:
+        state = _SESSION_STATE[0]
+        if state.id != session_id:
+            return
+        touched = SessionState(state.id, state.turns + 1 if success else state.turns, time.monotonic())
+        if _compare_and_set_session(state, touched):
             return
-        _SESSION_STATE["last_used"] = now
-        if success:
-            _SESSION_STATE["turns"] = int(_SESSION_STATE.get("turns", 0) or 0) + 1
 
 
 def _reset_session(session_id: str) -> None:
     if not session_id:
         return
-    with _SESSION_STATE_LOCK:
-        if str(_SESSION_STATE.get("id", "") or "") != session_id:
+    while True:
+        state = _SESSION_STATE[0]
+        if state.id != session_id:
+            return
+        if _compare_and_set_session(state, _EMPTY_SESSION):
             return
-        _SESSION_STATE["id"] = ""
-        _SESSION_STATE["turns"] = 0
-        _SESSION_STATE["last_used"] = 0.0
+
+
+def _session_exec_lock(session_id: str) -> contextlib.AbstractAsyncContextManager:
+    """같은 세션 ID의 CLI 실행만 직렬화한다. 세션을 쓰지 않으면 잠그지 않는다."""
+    if not session_id:
+        return contextlib.nullcontext()
+    current_id = _SESSION_STATE[0].id
+    for stale_id in [key for key, lock in _SESSION_EXEC_LOCKS.items() if key != current_id and not lock.locked()]:
+        _SESSION_EXEC_LOCKS.pop(stale_id, None)
+    lock = _SESSION_EXEC_LOCKS.get(session_id)
+    if lock is None:
+        lock = _SESSION_EXEC_LOCKS[session_id] = asyncio.Lock()
+    return lock
 
 
 def _maybe_reset_session_from_error(session_id: str, error_text: str) -> None:
@@ -148,8 +189,33 @@ def _build_command_with_session(base_command: list[str]) -> tuple[list[str], str
     return command, session_id
 
 
-def _build_full_input(transcript: str, prompt: str) -> str:
-    return f"{(prompt or '').strip()}\n\n[전사 텍스트]\n{(transcript or '').strip()}\n"
+@contextlib.asynccontextmanager
+async def _locked_session_command(base_command: list[str]) -> AsyncIterator[tuple[list[str], str]]:
+    """세션 실행 잠금을 잡은 뒤 세션을 다시 확인한다.
+
+    잠금을 기다리는 동안 앞선 실행이 턴 한도를 채우거나 세션을 리셋했으면
+    새로 빌린 세션의 잠금으로 다시 시도해, 교체된 세션 ID로 실행하지 않는다.
+    """
+    command, session_id = _build_command_with_session(base_command)
+    while True:
+        async with _session_exec_lock(session_id):
+            if not session_id or _lease_session_id()[0] == session_id:
+                yield command, session_id
+                return
+        command, session_id = _build_command_with_session(base_command)
+
+
+def _build_full_input(transcript: str, prompt: str) -> bytes:
+    """이미 strip된 transcript/prompt를 받아 stdin에 바로 쓸 UTF-8 바이트를 만든다."""
+    return f"{prompt}\n\n[전사 텍스트]\n{transcript}\n".encode("utf-8")
+
+
+def _normalize_inputs(transcript: str, prompt: str) -> tuple[str, str]:
+    text = (transcript or "").strip()
+    instruction = (prompt or "").strip()
+    if not text:
+        raise ValueError("본문 텍스트가 비어 있습니다.")
+    return text, instruction
 
 
 def run_claude(transcript: str, prompt: str, timeout_sec: int = 600) -> str:
@@ -158,37 +224,77 @@ def run_claude(transcript: str, prompt: str, timeout_sec: int = 600) -> str:
     prompt: Claude CLI에 전달할 지시문
     return: claude CLI가 stdout으로 출력한 결과 텍스트
     """
-    text = (transcript or "").strip()
-    instruction = (prompt or "").strip()
-    if not text:
-        raise ValueError("본문 텍스트가 비어 있습니다.")
-
+    text, instruction = _normalize_inputs(transcript, prompt)
     command, session_id = _build_command_with_session(_resolve_command())
-    full_input = _build_full_input(text, instruction)
-    timeout_value = max(1, int(timeout_sec or 1))
-    command_text = " ".join(command)
-    started_at = time.monotonic()
+    return _run_claude_prepared(command, session_id, text, instruction, timeout_sec)
+
+
+def _log_run_start(command: list[str], timeout_value: int, text: str, instruction: str, session_id: str) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         "Claude CLI start: command=%s timeout=%ss transcript_chars=%s prompt_chars=%s session=%s",
-        command_text,
+        " ".join(command),
         timeout_value,
         len(text),
         len(instruction),
         _session_label(session_id),
     )
 
+
+def _finish_run(returncode: int | None, stdout_text: str, stderr_text: str, session_id: str, started_at: float) -> str:
+    if returncode != 0:
+        stderr_text = (stderr_text or "").strip()
+        _touch_session(session_id, success=False)
+        _maybe_reset_session_from_error(session_id, stderr_text)
+        elapsed = time.monotonic() - started_at
+        logger.error(
+            "Claude CLI failed: returncode=%s duration=%.2fs stderr_preview=%s",
+            returncode,
+            elapsed,
+            _shorten_for_log(stderr_text),
+        )
+        raise RuntimeError(f"claude 실패(returncode={returncode}): {stderr_text}")
+
+    output = (stdout_text or "").strip()
+    if not output:
+        _touch_session(session_id, success=False)
+        elapsed = time.monotonic() - started_at
+        logger.error("Claude CLI empty output: duration=%.2fs", elapsed)
+        raise RuntimeError("claude CLI가 빈 결과를 반환했습니다.")
+    _touch_session(session_id, success=True)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Claude CLI done: duration=%.2fs output_preview=%s",
+            time.monotonic() - started_at,
+            _shorten_for_log(output),
+        )
+    return output
+
+
+def _run_claude_prepared(
+    command: list[str],
+    session_id: str,
+    text: str,
+    instruction: str,
+    timeout_sec: int,
+) -> str:
+    full_input = _build_full_input(text, instruction)
+    timeout_value = max(1, int(timeout_sec or 1))
+    started_at = time.monotonic()
+    _log_run_start(command, timeout_value, text, instruction, session_id)
+
     try:
         proc = subprocess.run(
             command,
             input=full_input,
-            text=True,
             capture_output=True,
             timeout=timeout_value,
             check=False,
         )
     except FileNotFoundError as exc:
         _touch_session(session_id, success=False)
-        logger.error("Claude CLI executable not found: command=%s", command_text)
+        logger.error("Claude CLI executable not found: command=%s", " ".join(command))
         raise RuntimeError("claude CLI를 찾을 수 없습니다. 설치 및 PATH 설정을 확인해 주세요.") from exc
     except subprocess.TimeoutExpired as exc:
         _touch_session(session_id, success=False)
@@ -196,39 +302,68 @@ def run_claude(transcript: str, prompt: str, timeout_sec: int = 600) -> str:
         logger.error("Claude CLI timeout: duration=%.2fs timeout=%ss", elapsed, timeout_value)
         raise RuntimeError(f"claude 실행 시간 초과({timeout_value}초)") from exc
 
-    if proc.returncode != 0:
-        stderr_text = (proc.stderr or "").strip()
-        _touch_session(session_id, success=False)
-        _maybe_reset_session_from_error(session_id, stderr_text)
-        elapsed = time.monotonic() - started_at
-        logger.error(
-            "Claude CLI failed: returncode=%s duration=%.2fs stderr_preview=%s",
-            proc.returncode,
-            elapsed,
-            _shorten_for_log(stderr_text),
+    return _finish_run(
+        proc.returncode,
+        proc.stdout.decode("utf-8", errors="replace"),
+        proc.stderr.decode("utf-8", errors="replace"),
+        session_id,
+        started_at,
+    )
+
+
+async def _run_async(
+    command: list[str],
+    session_id: str,
+    text: str,
+    instruction: str,
+    timeout_sec: int,
+) -> str:
+    """_run_claude_prepared와 동일하지만 스레드 없이 이벤트 루프에서 직접 subprocess를 기다린다."""
+    full_input = _build_full_input(text, instruction)
+    timeout_value = max(1, int(timeout_sec or 1))
+    started_at = time.monotonic()
+    _log_run_start(command, timeout_value, text, instruction, session_id)
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        raise RuntimeError(f"claude 실패(returncode={proc.returncode}): {stderr_text}")
+    except FileNotFoundError as exc:
+        _touch_session(session_id, success=False)
+        logger.error("Claude CLI executable not found: command=%s", " ".join(command))
+        raise RuntimeError("claude CLI를 찾을 수 없습니다. 설치 및 PATH 설정을 확인해 주세요.") from exc
 
-    output = (proc.stdout or "").strip()
-    if not output:
+    try:
+        stdout_data, stderr_data = await asyncio.wait_for(
+            proc.communicate(input=full_input),
+            timeout=timeout_value,
+        )
+    except asyncio.TimeoutError as exc:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
         _touch_session(session_id, success=False)
         elapsed = time.monotonic() - started_at
-        logger.error("Claude CLI empty output: duration=%.2fs", elapsed)
-        raise RuntimeError("claude CLI가 빈 결과를 반환했습니다.")
-    _touch_session(session_id, success=True)
-    elapsed = time.monotonic() - started_at
-    logger.info(
-        "Claude CLI done: duration=%.2fs output_preview=%s",
-        elapsed,
-        _shorten_for_log(output),
+        logger.error("Claude CLI timeout: duration=%.2fs timeout=%ss", elapsed, timeout_value)
+        raise RuntimeError(f"claude 실행 시간 초과({timeout_value}초)") from exc
+
+    return _finish_run(
+        proc.returncode,
+        stdout_data.decode("utf-8", errors="replace"),
+        stderr_data.decode("utf-8", errors="replace"),
+        session_id,
+        started_at,
     )
-    return output
 
 
 async def generate_with_claude_cli(transcript: str, prompt: str, timeout_sec: int | None = None) -> str:
     timeout_value = int(timeout_sec if timeout_sec is not None else settings.claude_cli_timeout_sec)
-    async with _SESSION_EXEC_LOCK:
-        return await asyncio.to_thread(run_claude, transcript, prompt, timeout_value)
+    text, instruction = _normalize_inputs(transcript, prompt)
+    async with _locked_session_command(_resolve_command()) as (command, session_id), _CLAUDE_SEM:
+        return await _run_async(command, session_id, text, instruction, timeout_value)
 
 
 async def stream_claude_cli(
@@ -236,35 +371,32 @@ async def stream_claude_cli(
     prompt: str,
     timeout_sec: int | None = None,
 ) -> AsyncIterator[dict]:
-    async with _SESSION_EXEC_LOCK:
-        async for event in _stream_claude_cli_locked(transcript, prompt, timeout_sec):
+    text, instruction = _normalize_inputs(transcript, prompt)
+    async with _locked_session_command(_resolve_command()) as (command, session_id), _CLAUDE_SEM:
+        async for event in _stream_claude_cli_locked(command, session_id, text, instruction, timeout_sec):
             yield event
 
 
 async def _stream_claude_cli_locked(
-    transcript: str,
-    prompt: str,
+    command: list[str],
+    session_id: str,
+    text: str,
+    instruction: str,
     timeout_sec: int | None = None,
 ) -> AsyncIterator[dict]:
-    text = (transcript or "").strip()
-    instruction = (prompt or "").strip()
-    if not text:
-        raise ValueError("본문 텍스트가 비어 있습니다.")
-
     timeout_value = int(timeout_sec if timeout_sec is not None else settings.claude_cli_timeout_sec)
     timeout_value = max(1, timeout_value)
-    command, session_id = _build_command_with_session(_resolve_command())
     full_input = _build_full_input(text, instruction)
-    command_text = " ".join(command)
     started_at = time.monotonic()
-    logger.info(
-        "Claude CLI stream start: command=%s timeout=%ss transcript_chars=%s prompt_chars=%s session=%s",
-        command_text,
-        timeout_value,
-        len(text),
-        len(instruction),
-        _session_label(session_id),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Claude CLI stream start: command=%s timeout=%ss transcript_chars=%s prompt_chars=%s session=%s",
+            " ".join(command),
+            timeout_value,
+            len(text),
+            len(instruction),
+            _session_label(session_id),
+        )
 
     try:
         process = await asyncio.create_subprocess_exec(
@@ -275,60 +407,52 @@ async def _stream_claude_cli_locked(
         )
     except FileNotFoundError as exc:
         _touch_session(session_id, success=False)
-        logger.error("Claude CLI stream executable not found: command=%s", command_text)
+        logger.error("Claude CLI stream executable not found: command=%s", " ".join(command))
         raise RuntimeError("claude CLI를 찾을 수 없습니다. 설치 및 PATH 설정을 확인해 주세요.") from exc
 
     if process.stdin is None or process.stdout is None or process.stderr is None:
         _touch_session(session_id, success=False)
         raise RuntimeError("claude CLI 입출력 파이프를 열 수 없습니다.")
 
-    process.stdin.write(full_input.encode("utf-8"))
-    await process.stdin.drain()
-    process.stdin.close()
-    if hasattr(process.stdin, "wait_closed"):
-        await process.stdin.wait_closed()
+    process.stdin.write(full_input)
+    # 파이프 버퍼를 넘는 큰 입력만 drain으로 흐름 제어를 기다리고, EOF는 write_eof로 바로 전달한다.
+    if len(full_input) > STDIN_PIPE_BUFFER_BYTES:
+        await process.stdin.drain()
+    process.stdin.write_eof()
 
-    queue: asyncio.Queue[dict] = asyncio.Queue()
     stdout_chunks: list[str] = []
     stderr_chunks: list[str] = []
+    streams = {"stdout": process.stdout, "stderr": process.stderr}
+    decoders = {channel: codecs.getincrementaldecoder("utf-8")(errors="replace") for channel in streams}
+    readers: dict[asyncio.Future, str] = {
+        asyncio.ensure_future(stream.read(STREAM_READ_CHUNK_BYTES)): channel for channel, stream in streams.items()
+    }
 
-    async def _pump(stream: asyncio.StreamReader, channel: str) -> None:
-        while True:
-            line = await stream.readline()
-            if not line:
-                break
-            text_line = line.decode("utf-8", errors="replace")
-            await queue.put({"type": "chunk", "channel": channel, "text": text_line})
-        await queue.put({"type": "eof", "channel": channel})
-
-    tasks = [
-        asyncio.create_task(_pump(process.stdout, "stdout")),
-        asyncio.create_task(_pump(process.stderr, "stderr")),
-    ]
-
-    eof_count = 0
     logged_stdout_preview = False
     logged_stderr_preview = False
     try:
         async with asyncio.timeout(timeout_value):
-            while eof_count < 2:
-                event = await queue.get()
-                if event.get("type") == "eof":
-                    eof_count += 1
-                    continue
-                if event.get("channel") == "stdout":
-                    row = str(event.get("text", ""))
-                    stdout_chunks.append(row)
-                    if not logged_stdout_preview:
-                        logger.info("Claude CLI stream stdout partial: %s", _shorten_for_log(row))
-                        logged_stdout_preview = True
-                else:
-                    row = str(event.get("text", ""))
-                    stderr_chunks.append(row)
-                    if not logged_stderr_preview:
-                        logger.warning("Claude CLI stream stderr partial: %s", _shorten_for_log(row))
-                        logged_stderr_preview = True
-                yield event
+            while readers:
+                done, _ = await asyncio.wait(readers, return_when=asyncio.FIRST_COMPLETED)
+                for reader in done:
+                    channel = readers.pop(reader)
+                    data = reader.result()
+                    if data:
+                        readers[asyncio.ensure_future(streams[channel].read(STREAM_READ_CHUNK_BYTES))] = channel
+                    row = decoders[channel].decode(data, final=not data)
+                    if not row:
+                        continue
+                    if channel == "stdout":
+                        stdout_chunks.append(row)
+                        if not logged_stdout_preview and logger.isEnabledFor(logging.INFO):
+                            logger.info("Claude CLI stream stdout partial: %s", _shorten_for_log(row))
+                            logged_stdout_preview = True
+                    else:
+                        stderr_chunks.append(row)
+                        if not logged_stderr_preview and logger.isEnabledFor(logging.WARNING):
+                            logger.warning("Claude CLI stream stderr partial: %s", _shorten_for_log(row))
+                            logged_stderr_preview = True
+                    yield {"type": "chunk", "channel": channel, "text": row}
             returncode = await process.wait()
     except TimeoutError as exc:
         process.kill()
@@ -338,9 +462,9 @@ async def _stream_claude_cli_locked(
         logger.error("Claude CLI stream timeout: duration=%.2fs timeout=%ss", elapsed, timeout_value)
         raise RuntimeError(f"claude 실행 시간 초과({timeout_value}초)") from exc
     finally:
-        for task in tasks:
-            task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
+        for reader in readers:
+            reader.cancel()
+        await asyncio.gather(*readers, return_exceptions=True)
 
     if returncode != 0:
         stderr_text = "".join(stderr_chunks).strip()
@@ -362,14 +486,21 @@ async def _stream_claude_cli_locked(
         logger.error("Claude CLI stream empty output: duration=%.2fs", elapsed)
         raise RuntimeError("claude CLI가 빈 결과를 반환했습니다.")
     _touch_session(session_id, success=True)
-    elapsed = time.monotonic() - started_at
-    logger.info(
-        "Claude CLI stream done: duration=%.2fs output_preview=%s",
-        elapsed,
-        _shorten_for_log(output),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Claude CLI stream done: duration=%.2fs output_preview=%s",
+            time.monotonic() - started_at,
+            _shorten_for_log(output),
+        )
     yield {"type": "done", "result": output}
 
 
 def save_markdown(out_path: Path, md: str):
-    out_path.write_text(md, encoding="utf-8")
+    # 임시 파일에 쓴 뒤 교체해, 쓰는 도중 중단되어도 반쯤 쓰인 파일이 남지 않게 한다.
+    tmp_path = out_path.with_name(f"{out_path.name}.tmp")
+    tmp_path.write_text(md, encoding="utf-8")
+    os.replace(tmp_path, out_path)
+
+
+async def save_markdown_async(out_path: Path, md: str):
+    await asyncio.to_thread(save_markdown, out_path, md)
@@ -1,8 +1,12 @@
 import asyncio
+import codecs
+import contextlib
 import logging
+import os
 import shlex
 import subprocess
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncIterator
 
@@ -10,120 +14,191 @@ from config.settings import settings
 
 logger = logging.getLogger("codex_cli")
 LOG_PREVIEW_LIMIT = 240
+STREAM_READ_CHUNK_BYTES = 65536
+STDIN_PIPE_BUFFER_BYTES = 65536
+_CODEX_SUBCOMMANDS = frozenset({
+    "exec",
+    "review",
+    "login",
+    "logout",
+    "mcp",
+    "mcp-server",
+    "app-server",
+    "app",
+    "completion",
+    "sandbox",
+    "debug",
+    "apply",
+    "a",
+    "resume",
+    "fork",
+    "cloud",
+    "features",
+    "help",
+})
+# 버스트 요청이 codex 프로세스를 무제한으로 띄우지 않도록 동시 실행 수를 제한한다.
+_CODEX_SEM = asyncio.Semaphore(max(1, int(getattr(settings, "codex_cli_max_parallel", 0) or 4)))
 
 
 def _shorten_for_log(text: str, limit: int = LOG_PREVIEW_LIMIT) -> str:
-    value = str(text or "").strip().replace("\n", "\\n")
-    if len(value) <= limit:
+    # 대용량 출력 전체를 훑지 않도록 앞부분만 잘라서 가공한다.
+    raw = str(text or "").lstrip()
+    value = raw[: limit + 32].rstrip().replace("\n", "\\n")
+    if len(value) <= limit and len(raw) <= limit + 32:
         return value
     return f"{value[:limit]}...(truncated)"
 
 
 def _resolve_command() -> list[str]:
-    command_text = (settings.codex_cli_command or "codex").strip()
+    return list(_resolve_command_cached(settings.codex_cli_command or "codex"))
+
+
+@lru_cache(maxsize=4)
+def _resolve_command_cached(command_text: str) -> tuple[str, ...]:
+    command_text = command_text.strip()
     command = shlex.split(command_text) if command_text else ["codex"]
     if not command:
-        return ["codex"]
+        return ("codex",)
     binary_name = Path(command[0]).name.lower()
-    codex_subcommands = {
-        "exec",
-        "review",
-        "login",
-        "logout",
-        "mcp",
-        "mcp-server",
-        "app-server",
-        "app",
-        "completion",
-        "sandbox",
-        "debug",
-        "apply",
-        "a",
-        "resume",
-        "fork",
-        "cloud",
-        "features",
-        "help",
-    }
-    has_subcommand = len(command) > 1 and command[1] in codex_subcommands
+    has_subcommand = len(command) > 1 and command[1] in _CODEX_SUBCOMMANDS
     if binary_name == "codex" and not has_subcommand:
         command = [command[0], "exec", *command[1:]]
-    return command
+    return tuple(command)
 
 
-def _build_full_input(transcript: str, prompt: str) -> str:
-    return f"{(prompt or '').strip()}\n\n[전사 텍스트]\n{(transcript or '').strip()}\n"
+def _build_full_input(transcript: str, prompt: str) -> bytes:
+    """이미 strip된 transcript/prompt를 받아 stdin에 바로 쓸 UTF-8 바이트를 만든다."""
+    return f"{prompt}\n\n[전사 텍스트]\n{transcript}\n".encode("utf-8")
 
 
-def run_codex(transcript: str, prompt: str, timeout_sec: int = 600) -> str:
-    """
-    transcript: 입력 본문 텍스트
-    prompt: Codex CLI에 전달할 지시문
-    return: codex CLI가 stdout으로 출력한 결과 텍스트
-    """
+def _normalize_inputs(transcript: str, prompt: str) -> tuple[str, str]:
     text = (transcript or "").strip()
     instruction = (prompt or "").strip()
     if not text:
         raise ValueError("본문 텍스트가 비어 있습니다.")
+    return text, instruction
 
-    command = _resolve_command()
-    full_input = _build_full_input(text, instruction)
-    timeout_value = max(1, int(timeout_sec or 1))
-    command_text = " ".join(command)
-    started_at = time.monotonic()
+
+def _log_run_start(command: list[str], timeout_value: int, text: str, instruction: str) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         "Codex CLI start: command=%s timeout=%ss transcript_chars=%s prompt_chars=%s",
-        command_text,
+        " ".join(command),
         timeout_value,
         len(text),
         len(instruction),
     )
 
+
+def _finish_run(returncode: int | None, stdout_text: str, stderr_text: str, started_at: float) -> str:
+    if returncode != 0:
+        stderr_text = (stderr_text or "").strip()
+        elapsed = time.monotonic() - started_at
+        logger.error(
+            "Codex CLI failed: returncode=%s duration=%.2fs stderr_preview=%s",
+            returncode,
+            elapsed,
+            _shorten_for_log(stderr_text),
+        )
+        raise RuntimeError(f"codex 실패(returncode={returncode}): {stderr_text}")
+
+    output = (stdout_text or "").strip()
+    if not output:
+        elapsed = time.monotonic() - started_at
+        logger.error("Codex CLI empty output: duration=%.2fs", elapsed)
+        raise RuntimeError("codex CLI가 빈 결과를 반환했습니다.")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Codex CLI done: duration=%.2fs output_preview=%s",
+            time.monotonic() - started_at,
+            _shorten_for_log(output),
+        )
+    return output
+
+
+def run_codex(transcript: str, prompt: str, timeout_sec: int = 600) -> str:
+    """
+    transcript: 입력 본문 텍스트
+    prompt: Codex CLI에 전달할 지시문
+    return: codex CLI가 stdout으로 출력한 결과 텍스트
+    """
+    text, instruction = _normalize_inputs(transcript, prompt)
+    command = _resolve_command()
+    full_input = _build_full_input(text, instruction)
+    timeout_value = max(1, int(timeout_sec or 1))
+    started_at = time.monotonic()
+    _log_run_start(command, timeout_value, text, instruction)
+
     try:
         proc = subprocess.run(
             command,
             input=full_input,
-            text=True,
             capture_output=True,
             timeout=timeout_value,
             check=False,
         )
     except FileNotFoundError as exc:
-        logger.error("Codex CLI executable not found: command=%s", command_text)
+        logger.error("Codex CLI executable not found: command=%s", " ".join(command))
         raise RuntimeError("codex CLI를 찾을 수 없습니다. 설치 및 PATH 설정을 확인해 주세요.") from exc
     except subprocess.TimeoutExpired as exc:
         elapsed = time.monotonic() - started_at
         logger.error("Codex CLI timeout: duration=%.2fs timeout=%ss", elapsed, timeout_value)
         raise RuntimeError(f"codex 실행 시간 초과({timeout_value}초)") from exc
 
-    if proc.returncode != 0:
-        stderr_text = (proc.stderr or "").strip()
-        elapsed = time.monotonic() - started_at
-        logger.error(
-            "Codex CLI failed: returncode=%s duration=%.2fs stderr_preview=%s",
-            proc.returncode,
-            elapsed,
-            _shorten_for_log(stderr_text),
+    return _finish_run(
+        proc.returncode,
+        proc.stdout.decode("utf-8", errors="replace"),
+        proc.stderr.decode("utf-8", errors="replace"),
+        started_at,
+    )
+
+
+async def _run_async(text: str, instruction: str, timeout_sec: int) -> str:
+    """run_codex와 동일하지만 스레드 없이 이벤트 루프에서 직접 subprocess를 기다린다."""
+    command = _resolve_command()
+    full_input = _build_full_input(text, instruction)
+    timeout_value = max(1, int(timeout_sec or 1))
+    started_at = time.monotonic()
+    _log_run_start(command, timeout_value, text, instruction)
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        raise RuntimeError(f"codex 실패(returncode={proc.returncode}): {stderr_text}")
+    except FileNotFoundError as exc:
+        logger.error("Codex CLI executable not found: command=%s", " ".join(command))
+        raise RuntimeError("codex CLI를 찾을 수 없습니다. 설치 및 PATH 설정을 확인해 주세요.") from exc
 
-    output = (proc.stdout or "").strip()
-    if not output:
+    try:
+        stdout_data, stderr_data = await asyncio.wait_for(
+            proc.communicate(input=full_input),
+            timeout=timeout_value,
+        )
+    except asyncio.TimeoutError as exc:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
         elapsed = time.monotonic() - started_at
-        logger.error("Codex CLI empty output: duration=%.2fs", elapsed)
-        raise RuntimeError("codex CLI가 빈 결과를 반환했습니다.")
-    elapsed = time.monotonic() - started_at
-    logger.info(
-        "Codex CLI done: duration=%.2fs output_preview=%s",
-        elapsed,
-        _shorten_for_log(output),
+        logger.error("Codex CLI timeout: duration=%.2fs timeout=%ss", elapsed, timeout_value)
+        raise RuntimeError(f"codex 실행 시간 초과({timeout_value}초)") from exc
+
+    return _finish_run(
+        proc.returncode,
+        stdout_data.decode("utf-8", errors="replace"),
+        stderr_data.decode("utf-8", errors="replace"),
+        started_at,
     )
-    return output
 
 
 async def generate_with_codex_cli(transcript: str, prompt: str, timeout_sec: int | None = None) -> str:
     timeout_value = int(timeout_sec if timeout_sec is not None else settings.codex_cli_timeout_sec)
-    return await asyncio.to_thread(run_codex, transcript, prompt, timeout_value)
+    text, instruction = _normalize_inputs(transcript, prompt)
+    async with _CODEX_SEM:
+        return await _run_async(text, instruction, timeout_value)
 
 
 async def stream_codex_cli(
@@ -131,24 +206,30 @@ async def stream_codex_cli(
     prompt: str,
     timeout_sec: int | None = None,
 ) -> AsyncIterator[dict]:
-    text = (transcript or "").strip()
-    instruction = (prompt or "").strip()
-    if not text:
-        raise ValueError("본문 텍스트가 비어 있습니다.")
+    text, instruction = _normalize_inputs(transcript, prompt)
+    async with _CODEX_SEM:
+        async for event in _stream_codex_cli_locked(text, instruction, timeout_sec):
+            yield event
+
 
+async def _stream_codex_cli_locked(
+    text: str,
+    instruction: str,
+    timeout_sec: int | None = None,
+) -> AsyncIterator[dict]:
     timeout_value = int(timeout_sec if timeout_sec is not None else settings.codex_cli_timeout_sec)
     timeout_value = max(1, timeout_value)
     command = _resolve_command()
     full_input = _build_full_input(text, instruction)
-    command_text = " ".join(command)
     started_at = time.monotonic()
-    logger.info(
-        "Codex CLI stream start: command=%s timeout=%ss transcript_chars=%s prompt_chars=%s",
-        command_text,
-        timeout_value,
-        len(text),
-        len(instruction),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Codex CLI stream start: command=%s timeout=%ss transcript_chars=%s prompt_chars=%s",
+            " ".join(command),
+            timeout_value,
+            len(text),
+            len(instruction),
+        )
 
     try:
         process = await asyncio.create_subprocess_exec(
@@ -158,59 +239,51 @@ async def stream_codex_cli(
             stderr=asyncio.subprocess.PIPE,
         )
     except FileNotFoundError as exc:
-        logger.error("Codex CLI stream executable not found: command=%s", command_text)
+        logger.error("Codex CLI stream executable not found: command=%s", " ".join(command))
         raise RuntimeError("codex CLI를 찾을 수 없습니다. 설치 및 PATH 설정을 확인해 주세요.") from exc
 
     if process.stdin is None or process.stdout is None or process.stderr is None:
         raise RuntimeError("codex CLI 입출력 파이프를 열 수 없습니다.")
 
-    process.stdin.write(full_input.encode("utf-8"))
-    await process.stdin.drain()
-    process.stdin.close()
-    if hasattr(process.stdin, "wait_closed"):
-        await process.stdin.wait_closed()
+    process.stdin.write(full_input)
+    # 파이프 버퍼를 넘는 큰 입력만 drain으로 흐름 제어를 기다리고, EOF는 write_eof로 바로 전달한다.
+    if len(full_input) > STDIN_PIPE_BUFFER_BYTES:
+        await process.stdin.drain()
+    process.stdin.write_eof()
 
-    queue: asyncio.Queue[dict] = asyncio.Queue()
     stdout_chunks: list[str] = []
     stderr_chunks: list[str] = []
+    streams = {"stdout": process.stdout, "stderr": process.stderr}
+    decoders = {channel: codecs.getincrementaldecoder("utf-8")(errors="replace") for channel in streams}
+    readers: dict[asyncio.Future, str] = {
+        asyncio.ensure_future(stream.read(STREAM_READ_CHUNK_BYTES)): channel for channel, stream in streams.items()
+    }
 
-    async def _pump(stream: asyncio.StreamReader, channel: str) -> None:
-        while True:
-            line = await stream.readline()
-            if not line:
-                break
-            text_line = line.decode("utf-8", errors="replace")
-            await queue.put({"type": "chunk", "channel": channel, "text": text_line})
-        await queue.put({"type": "eof", "channel": channel})
-
-    tasks = [
-        asyncio.create_task(_pump(process.stdout, "stdout")),
-        asyncio.create_task(_pump(process.stderr, "stderr")),
-    ]
-
-    eof_count = 0
     logged_stdout_preview = False
     logged_stderr_preview = False
     try:
         async with asyncio.timeout(timeout_value):
-            while eof_count < 2:
-                event = await queue.get()
-                if event.get("type") == "eof":
-                    eof_count += 1
-                    continue
-                if event.get("channel") == "stdout":
-                    row = str(event.get("text", ""))
-                    stdout_chunks.append(row)
-                    if not logged_stdout_preview:
-                        logger.info("Codex CLI stream stdout partial: %s", _shorten_for_log(row))
-                        logged_stdout_preview = True
-                else:
-                    row = str(event.get("text", ""))
-                    stderr_chunks.append(row)
-                    if not logged_stderr_preview:
-                        logger.warning("Codex CLI stream stderr partial: %s", _shorten_for_log(row))
-                        logged_stderr_preview = True
-                yield event
+            while readers:
+                done, _ = await asyncio.wait(readers, return_when=asyncio.FIRST_COMPLETED)
+                for reader in done:
+                    channel = readers.pop(reader)
+                    data = reader.result()
+                    if data:
+                        readers[asyncio.ensure_future(streams[channel].read(STREAM_READ_CHUNK_BYTES))] = channel
+                    row = decoders[channel].decode(data, final=not data)
+                    if not row:
+                        continue
+                    if channel == "stdout":
+                        stdout_chunks.append(row)
+                        if not logged_stdout_preview and logger.isEnabledFor(logging.INFO):
+                            logger.info("Codex CLI stream stdout partial: %s", _shorten_for_log(row))
+                            logged_stdout_preview = True
+                    else:
+                        stderr_chunks.append(row)
+                        if not logged_stderr_preview and logger.isEnabledFor(logging.WARNING):
+                            logger.warning("Codex CLI stream stderr partial: %s", _shorten_for_log(row))
+                            logged_stderr_preview = True
+                    yield {"type": "chunk", "channel": channel, "text": row}
             returncode = await process.wait()
     except TimeoutError as exc:
         process.kill()
@@ -219,9 +292,9 @@ async def stream_codex_cli(
         logger.error("Codex CLI stream timeout: duration=%.2fs timeout=%ss", elapsed, timeout_value)
         raise RuntimeError(f"codex 실행 시간 초과({timeout_value}초)") from exc
     finally:
-        for task in tasks:
-            task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
+        for reader in readers:
+            reader.cancel()
+        await asyncio.gather(*readers, return_exceptions=True)
 
     if returncode != 0:
         stderr_text = "".join(stderr_chunks).strip()
@@ -239,14 +312,21 @@ async def stream_codex_cli(
         elapsed = time.monotonic() - started_at
         logger.error("Codex CLI stream empty output: duration=%.2fs", elapsed)
         raise RuntimeError("codex CLI가 빈 결과를 반환했습니다.")
-    elapsed = time.monotonic() - started_at
-    logger.info(
-        "Codex CLI stream done: duration=%.2fs output_preview=%s",
-        elapsed,
-        _shorten_for_log(output),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Codex CLI stream done: duration=%.2fs output_preview=%s",
+            time.monotonic() - started_at,
+            _shorten_for_log(output),
+        )
     yield {"type": "done", "result": output}
 
 
 def save_markdown(out_path: Path, md: str):
-    out_path.write_text(md, encoding="utf-8")
+    # 임시 파일에 쓴 뒤 교체해, 쓰는 도중 중단되어도 반쯤 쓰인 파일이 남지 않게 한다.
+    tmp_path = out_path.with_name(f"{out_path.name}.tmp")
+    tmp_path.write_text(md, encoding="utf-8")
+    os.replace(tmp_path, out_path)
+
+
+async def save_markdown_async(out_path: Path, md: str):
+    await asyncio.to_thread(save_markdown, out_path, md)
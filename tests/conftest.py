@@ -4,6 +4,18 @@ from pathlib import Path
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path_factory, monkeypatch):
+    """설정 API를 호출하는 테스트가 저장소의 data/viewer_config.json을 덮어쓰지 않게 한다."""
+    from web import config
+
+    config_dir = tmp_path_factory.mktemp("config")
+    monkeypatch.setattr(config, "DATA_DIR", config_dir)
+    monkeypatch.setattr(config, "CONFIG_FILE", config_dir / "viewer_config.json")
+    monkeypatch.setattr(config, "_cache", {})
+    monkeypatch.setattr(config, "_cache_mtime_ns", -1)
+
+
 @pytest.fixture
 def tmp_vault(tmp_path):
     """Create a temporary vault with sample files."""
@@ -1,5 +1,9 @@
 """테스트: 파일 검색/필터 기능 - 트리 API와 프론트엔드 검색 지원 확인"""
 
+import shutil
+
+from web.routers import files
+
 
 def test_tree_returns_files(client):
     """트리 API가 파일 목록을 정상 반환하는지 확인"""
@@ -21,6 +25,23 @@ def test_tree_contains_nested_files(client):
     assert "sub" in child_names
 
 
+def test_tree_cache_drops_removed_dirs_and_resets_on_vault_change(tmp_vault, tmp_path_factory, monkeypatch):
+    """삭제된 하위 폴더의 캐시 항목이 지워지고, 볼트가 바뀌면 캐시가 비워지는지 확인"""
+    monkeypatch.setattr(files, "_TREE_CACHE", {})
+    files._build_tree(tmp_vault)
+    sub = str(tmp_vault / "Notes" / "sub")
+    assert sub in files._TREE_CACHE
+
+    shutil.rmtree(sub)
+    files._build_tree(tmp_vault)
+    assert sub not in files._TREE_CACHE
+
+    other = tmp_path_factory.mktemp("other_vault")
+    (other / "a.md").write_text("a", encoding="utf-8")
+    files._build_tree(other)
+    assert set(files._TREE_CACHE) == {str(other)}
+
+
 def test_index_contains_search_input(client):
     """메인 페이지에 검색 입력 필드가 존재하는지 확인"""
     res = client.get("/")
@@ -1,8 +1,10 @@
 """테스트: Git Push 파일 선택 기능"""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
-from web.routers.git import _parse_changed_files
+from web.routers import git as git_router
+from web.routers.git import _format_porcelain_z, _parse_changed_files
 
 
 def test_git_push_modal_has_file_list(client):
@@ -32,6 +34,12 @@ def test_parse_changed_files_handles_rename_and_untracked():
     assert "c.md" in paths
 
 
+def test_format_porcelain_z_drops_rename_source():
+    """porcelain -z 출력을 줄 단위로 바꾸고 rename 원래 경로는 제외하는지 확인"""
+    raw = " M a.md\0R  new.md\0old.md\0?? 새 파일.md\0".encode("utf-8")
+    assert _format_porcelain_z(raw) == " M a.md\nR  new.md\n?? 새 파일.md"
+
+
 def test_git_changes_endpoint_returns_files(client):
     """변경 파일 조회 API가 파싱된 목록을 반환하는지 확인"""
     mocked = AsyncMock(return_value=(0, " M alpha.md\n?? beta.txt\n", ""))
@@ -47,3 +55,18 @@ def test_git_push_requires_selected_files(client):
     """Push API는 선택 파일이 없으면 400을 반환하는지 확인"""
     res = client.post("/api/git/push", json={"message": "msg", "files": []})
     assert res.status_code == 400
+
+
+def test_failed_push_step_is_reported_as_error_event(tmp_vault, monkeypatch):
+    """sh -c로 묶은 단계가 실패하면 error 이벤트가 나가고 다음 단계는 계속 실행되는지 확인"""
+    monkeypatch.setattr(git_router, "get_vault_path", lambda: tmp_vault)
+    script = "; ".join([git_router._step_or_report("false", "git add"), "echo pushed"])
+
+    async def collect():
+        return [frame async for frame in git_router._run_vault_stream(["sh", "-c", script])]
+
+    frames = asyncio.run(collect())
+    events = [frame.split(b"\n", 1)[0] for frame in frames]
+    assert events == [b"event: error", b"event: chunk", b"event: done"]
+    assert "오류: git add 실패 (returncode=1)".encode("utf-8") in frames[0]
+    assert b"\x1e" not in b"".join(frames)
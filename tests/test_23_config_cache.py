@@ -0,0 +1,52 @@
+"""테스트: 설정 파일 mtime 기반 캐시"""
+
+import json
+import os
+
+import pytest
+
+from web import config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(config, "CONFIG_FILE", tmp_path / "viewer_config.json")
+    monkeypatch.setattr(config, "_cache", {})
+    monkeypatch.setattr(config, "_cache_mtime_ns", -1)
+    return tmp_path / "viewer_config.json"
+
+
+def test_set_then_get_uses_saved_value(config_file):
+    """set_* 직후 get_*이 저장된 값을 반환하는지 확인"""
+    config.set_issue_folder("Team/Issues")
+    assert config.get_issue_folder() == "Team/Issues"
+    assert json.loads(config_file.read_text(encoding="utf-8"))["issue_folder"] == "Team/Issues"
+
+
+def test_external_edit_invalidates_cache(config_file):
+    """파일이 외부에서 수정되면 mtime 변경으로 다시 읽는지 확인"""
+    config.set_issue_folder("first")
+    assert config.get_issue_folder() == "first"
+
+    config_file.write_text(json.dumps({"issue_folder": "second"}), encoding="utf-8")
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert config.get_issue_folder() == "second"
+
+
+def test_load_returns_copy(config_file):
+    """_load 결과를 수정해도 캐시가 오염되지 않는지 확인"""
+    config.set_nlm_enabled(True)
+    data = config._load()
+    data["nlm_enabled"] = False
+    assert config.get_nlm_enabled() is True
+
+
+def test_save_skips_unchanged_and_leaves_no_tmp(config_file):
+    """값이 같으면 다시 쓰지 않고, 임시 파일이 남지 않는지 확인"""
+    config.set_auto_watch_enabled(True)
+    mtime = config_file.stat().st_mtime_ns
+    config.set_auto_watch_enabled(True)
+    assert config_file.stat().st_mtime_ns == mtime
+    assert not config_file.with_suffix(".json.tmp").exists()
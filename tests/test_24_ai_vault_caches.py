@@ -0,0 +1,86 @@
+"""테스트: AI 라우터의 볼트 스캔/이슈 번호/템플릿 캐시"""
+
+import os
+import shutil
+
+from web.routers import ai
+
+
+def _bump_mtime(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_scan_watch_candidates_picks_up_nested_changes(tmp_vault):
+    """캐시된 상위 폴더 아래 하위 폴더에 파일이 추가되어도 스캔에 반영되는지 확인"""
+    first = ai._scan_watch_candidates(tmp_vault)
+    assert os.path.join("Notes", "sub", "deep.md") in first
+    assert os.path.join("Notes", "diagram.png") not in first
+
+    (tmp_vault / "Notes" / "sub" / "new.md").write_text("new", encoding="utf-8")
+    second = ai._scan_watch_candidates(tmp_vault)
+    assert os.path.join("Notes", "sub", "new.md") in second
+
+
+def test_scan_watch_candidates_drops_removed_subdirs(tmp_vault, monkeypatch):
+    """상위 폴더를 다시 읽을 때 사라진 하위 폴더의 _DIR_CACHE 항목이 지워지는지 확인"""
+    monkeypatch.setattr(ai, "_DIR_CACHE", {})
+    (tmp_vault / "Notes" / "sub" / "inner").mkdir()
+    ai._scan_watch_candidates(tmp_vault)
+    sub = str(tmp_vault / "Notes" / "sub")
+    assert sub in ai._DIR_CACHE
+    assert os.path.join(sub, "inner") in ai._DIR_CACHE
+
+    shutil.rmtree(sub)
+    ai._scan_watch_candidates(tmp_vault)
+    assert sub not in ai._DIR_CACHE
+    assert os.path.join(sub, "inner") not in ai._DIR_CACHE
+
+
+def test_save_ai_output_increments_issue_number(tmp_vault):
+    """연속 저장 시 이슈 번호가 증가하고 기존 파일을 덮어쓰지 않는지 확인"""
+    source = tmp_vault / "Notes" / "hello.md"
+    first = ai._save_ai_output(tmp_vault, "Notes/hello.md", source, "# 회의록")
+    second = ai._save_ai_output(tmp_vault, "Notes/hello.md", source, "# 회의록")
+    assert first["name"] == "Notes_001_회의록.md"
+    assert second["name"] == "Notes_002_회의록.md"
+
+
+def test_save_ai_output_rescans_after_manual_edit(tmp_vault):
+    """Issues 폴더에 파일이 수동으로 추가되면 다음 번호를 다시 계산하는지 확인"""
+    source = tmp_vault / "Notes" / "hello.md"
+    ai._save_ai_output(tmp_vault, "Notes/hello.md", source, "# A")
+    (tmp_vault / "Notes" / "Issues" / "Notes_010_manual.md").write_text("m", encoding="utf-8")
+    result = ai._save_ai_output(tmp_vault, "Notes/hello.md", source, "# B")
+    assert result["name"] == "Notes_011_B.md"
+
+
+def test_read_template_refreshes_on_mtime_change(tmp_path):
+    """템플릿이 수정되면 mtime 변경으로 다시 읽는지 확인"""
+    template = tmp_path / "Template_Issue.md"
+    assert ai._read_template(template) is None
+
+    template.write_text("v1", encoding="utf-8")
+    assert ai._read_template(template) == "v1"
+
+    template.write_text("v2", encoding="utf-8")
+    _bump_mtime(template)
+    assert ai._read_template(template) == "v2"
+
+
+def test_build_context_refreshes_when_issues_change(tmp_vault, monkeypatch):
+    """Issues 폴더에 파일이 추가되면 캐시된 컨텍스트 대신 새 목록을 반환하는지 확인"""
+    monkeypatch.setattr(ai, "_CONTEXT_CACHE", {})
+    issues_dir = tmp_vault / "Notes" / "Issues"
+    issues_dir.mkdir()
+    first = ai._build_context(tmp_vault, "Notes/hello.md")
+    assert "비어 있음" in first
+
+    other = ai._build_context(tmp_vault, "Notes/sub/deep.md")
+    assert "- 파일 경로: Notes/sub/deep.md" in other
+    assert len(ai._CONTEXT_CACHE) == 1
+
+    (issues_dir / "Notes_001_first.md").write_text("x", encoding="utf-8")
+    _bump_mtime(issues_dir)
+    second = ai._build_context(tmp_vault, "Notes/hello.md")
+    assert "- Notes_001_first.md" in second
@@ -0,0 +1,18 @@
+"""테스트: 볼트 경로 탈출 차단"""
+
+
+def test_file_api_rejects_sibling_prefix_path(client, tmp_vault):
+    """볼트와 이름이 같은 접두사로 시작하는 형제 폴더에 접근할 수 없는지 확인"""
+    sibling = tmp_vault.parent / f"{tmp_vault.name}-other"
+    sibling.mkdir()
+    (sibling / "secret.md").write_text("secret", encoding="utf-8")
+
+    res = client.get("/api/file", params={"path": f"../{sibling.name}/secret.md"})
+    assert res.status_code == 403
+
+
+def test_file_api_allows_nested_path(client):
+    """볼트 내부 하위 경로는 정상적으로 읽히는지 확인"""
+    res = client.get("/api/file", params={"path": "Notes/sub/deep.md"})
+    assert res.status_code == 200
+    assert res.json()["name"] == "deep.md"
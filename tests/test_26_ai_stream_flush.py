@@ -0,0 +1,56 @@
+"""테스트: AI 스트리밍 SSE 버퍼 flush"""
+
+import asyncio
+import sys
+
+from web.routers import ai
+
+_DRIP_SCRIPT = (
+    "import sys, time\n"
+    "sys.stdin.read()\n"
+    "for _ in range(60):\n"
+    "    sys.stdout.write('tok ')\n"
+    "    sys.stdout.flush()\n"
+    "    time.sleep(0.01)\n"
+)
+
+
+async def _collect(command: list[str]) -> list[tuple[float, bytes]]:
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    frames = []
+    async for frame in ai._stream_subprocess(command, "", timeout_sec=30):
+        frames.append((loop.time() - started, frame))
+    return frames
+
+
+def _chunk_payload(frames: list[tuple[float, bytes]]) -> bytes:
+    # 프론트 readSSE와 같이 data 줄을 "\n"으로 이어 붙이고, chunk 프레임끼리는 그대로 이어 붙인다.
+    payloads = []
+    for _, frame in frames:
+        if not frame.startswith(b"event: chunk"):
+            continue
+        lines = [line[len(b"data: "):] for line in frame.split(b"\n") if line.startswith(b"data: ")]
+        payloads.append(b"\n".join(lines))
+    return b"".join(payloads)
+
+
+def test_stream_subprocess_flushes_before_eof_for_dripping_output():
+    """출력이 25ms보다 촘촘하게 계속 들어와도 종료 전에 chunk 프레임이 나가는지 확인"""
+    frames = asyncio.run(_collect([sys.executable, "-c", _DRIP_SCRIPT]))
+
+    chunk_times = [at for at, frame in frames if frame.startswith(b"event: chunk")]
+    done_times = [at for at, frame in frames if frame.startswith(b"event: done")]
+    assert done_times, frames
+    assert len(chunk_times) >= 3
+    assert chunk_times[0] < done_times[0] - 0.2
+    assert _chunk_payload(frames) == b"tok " * 60
+
+
+def test_stream_subprocess_keeps_multibyte_output_intact():
+    """64KB 단위로 읽어도 멀티바이트 문자가 깨지지 않고 chunk로 모두 전달되는지 확인"""
+    script = "import sys; sys.stdin.read(); sys.stdout.write('가' * 30000)"
+    frames = asyncio.run(_collect([sys.executable, "-c", script]))
+
+    assert frames[-1][1].startswith(b"event: done")
+    assert _chunk_payload(frames) == "가".encode("utf-8") * 30000
@@ -0,0 +1,165 @@
+"""테스트: watchfiles 기반 auto-watch 이벤트 처리"""
+
+import asyncio
+import os
+import shutil
+
+import pytest
+
+from web.routers import ai
+
+
+@pytest.fixture
+def watch_env(tmp_vault, monkeypatch):
+    handled: list[str] = []
+
+    async def fake_handle(rel_path: str) -> None:
+        handled.append(rel_path)
+
+    monkeypatch.setattr(ai, "get_vault_path", lambda: tmp_vault)
+    monkeypatch.setattr(ai, "get_issue_folder", lambda: "issue")
+    monkeypatch.setattr(ai, "_handle_auto_watch_file", fake_handle)
+    monkeypatch.setitem(ai._AUTO_WATCH_STATE, "enabled", True)
+    monkeypatch.setitem(ai._AUTO_WATCH_STATE, "vault_path", "")
+    monkeypatch.setitem(ai._AUTO_WATCH_STATE, "known_files", set())
+    monkeypatch.setitem(ai._AUTO_WATCH_STATE, "stop_event", None)
+    return tmp_vault, handled
+
+
+async def _run_watcher(action, handled: list[str], expected: set[str], timeout: float = 5.0) -> None:
+    task = asyncio.create_task(ai._auto_watch_loop())
+    try:
+        await asyncio.sleep(0.5)  # 초기 스냅샷과 watcher 준비 대기
+        action()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not expected <= set(handled) and loop.time() < deadline:
+            await asyncio.sleep(0.05)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def test_new_file_is_processed_once(watch_env):
+    """새 md 파일은 처리되고, 기존 파일과 대상이 아닌 파일은 무시되는지 확인"""
+    vault, handled = watch_env
+
+    def action():
+        (vault / "Notes" / "new.md").write_text("new", encoding="utf-8")
+        (vault / "Notes" / "script.py").write_text("x", encoding="utf-8")
+
+    expected = {os.path.join("Notes", "new.md")}
+    asyncio.run(_run_watcher(action, handled, expected))
+
+    assert handled == [os.path.join("Notes", "new.md")]
+    assert os.path.join("Notes", "new.md") in ai._AUTO_WATCH_STATE["known_files"]
+    assert os.path.join("Notes", "hello.md") in ai._AUTO_WATCH_STATE["known_files"]
+
+
+def test_moved_in_directory_files_are_processed(watch_env, tmp_path_factory):
+    """볼트 밖에서 폴더를 통째로 옮겨 오면 그 안의 파일들이 처리되는지 확인"""
+    vault, handled = watch_env
+    outside = tmp_path_factory.mktemp("outside") / "meeting"
+    (outside / "nested").mkdir(parents=True)
+    (outside / "a.md").write_text("a", encoding="utf-8")
+    (outside / "nested" / "b.txt").write_text("b", encoding="utf-8")
+    (outside / "image.png").write_bytes(b"\x89PNG")
+
+    def action():
+        shutil.move(str(outside), str(vault / "Notes" / "meeting"))
+
+    expected = {
+        os.path.join("Notes", "meeting", "a.md"),
+        os.path.join("Notes", "meeting", "nested", "b.txt"),
+    }
+    asyncio.run(_run_watcher(action, handled, expected))
+
+    assert set(handled) == expected
+    assert expected <= ai._AUTO_WATCH_STATE["known_files"]
+
+
+def test_deleted_directory_is_removed_from_known_files(watch_env):
+    """폴더를 삭제하면 그 안의 파일이 known_files에서 빠지는지 확인"""
+    vault, handled = watch_env
+    deep = os.path.join("Notes", "sub", "deep.md")
+
+    async def scenario():
+        task = asyncio.create_task(ai._auto_watch_loop())
+        try:
+            await asyncio.sleep(0.5)
+            assert deep in ai._AUTO_WATCH_STATE["known_files"]
+            shutil.rmtree(vault / "Notes" / "sub")
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 5.0
+            while deep in ai._AUTO_WATCH_STATE["known_files"] and loop.time() < deadline:
+                await asyncio.sleep(0.05)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert deep not in ai._AUTO_WATCH_STATE["known_files"]
+    assert handled == []
+
+
+def test_next_batch_starts_while_previous_file_is_running(watch_env, monkeypatch):
+    """앞 배치 파일 처리가 끝나지 않아도 다음 배치 파일 처리가 바로 시작되는지 확인"""
+    vault, _ = watch_env
+    started: dict[str, float] = {}
+    finished: dict[str, float] = {}
+
+    async def slow_handle(rel_path: str) -> None:
+        loop = asyncio.get_running_loop()
+        started[rel_path] = loop.time()
+        await asyncio.sleep(3.0)
+        finished[rel_path] = loop.time()
+
+    monkeypatch.setattr(ai, "_handle_auto_watch_file", slow_handle)
+    first = os.path.join("Notes", "a.md")
+    second = os.path.join("Notes", "b.md")
+
+    async def scenario():
+        task = asyncio.create_task(ai._auto_watch_loop())
+        try:
+            await asyncio.sleep(0.5)
+            (vault / "Notes" / "a.md").write_text("a", encoding="utf-8")
+            await asyncio.sleep(0.6)
+            (vault / "Notes" / "b.md").write_text("b", encoding="utf-8")
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 2.0
+            while second not in started and loop.time() < deadline:
+                await asyncio.sleep(0.05)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            pending = list(ai._AUTO_WATCH_TASKS)
+            for pending_task in pending:
+                pending_task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert first in started
+    assert second in started
+    assert first not in finished
+
+
+def test_file_created_while_watcher_restarts_is_processed(watch_env):
+    """감시가 멈췄다가 다시 시작되는 사이에 생긴 파일도 재시작 후 처리되는지 확인"""
+    vault, handled = watch_env
+    created = os.path.join("Notes", "gap.md")
+
+    async def scenario():
+        first = asyncio.create_task(ai._auto_watch_loop())
+        await asyncio.sleep(0.5)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        assert ai._AUTO_WATCH_STATE["vault_path"] == str(vault)
+
+        (vault / "Notes" / "gap.md").write_text("gap", encoding="utf-8")
+        (vault / "Notes" / "hello.md").unlink()
+        await _run_watcher(lambda: None, handled, {created})
+
+    asyncio.run(scenario())
+    assert handled == [created]
+    assert created in ai._AUTO_WATCH_STATE["known_files"]
+    assert os.path.join("Notes", "hello.md") not in ai._AUTO_WATCH_STATE["known_files"]
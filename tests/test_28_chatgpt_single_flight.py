@@ -0,0 +1,68 @@
+"""테스트: ChatGPT 동일 요청 single-flight"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("config.settings")
+pytest.importorskip("models.prompt_settings")
+
+from services import chatgpt_service  # noqa: E402
+
+
+@pytest.fixture
+def fake_completion(monkeypatch):
+    calls: list[list[dict[str, str]]] = []
+    release = asyncio.Event()
+
+    async def fake_request(messages, temperature, prompt_cache_key):
+        calls.append(messages)
+        await release.wait()
+        return "응답"
+
+    async def no_cache(key):
+        return None
+
+    async def skip_put(key, content):
+        return None
+
+    monkeypatch.setattr(chatgpt_service, "_request_completion", fake_request)
+    monkeypatch.setattr(chatgpt_service, "_cache_get", no_cache)
+    monkeypatch.setattr(chatgpt_service, "_cache_put", skip_put)
+    monkeypatch.setattr(chatgpt_service, "_inflight", {})
+    return calls, release
+
+
+def test_concurrent_duplicates_share_one_call(fake_completion):
+    """동시에 들어온 같은 요청은 API를 한 번만 호출하고 같은 결과를 받는지 확인"""
+    calls, release = fake_completion
+
+    async def scenario():
+        tasks = [asyncio.create_task(chatgpt_service.call_chatgpt("sys", "user")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(scenario()) == ["응답", "응답", "응답"]
+    assert len(calls) == 1
+
+
+def test_cancelling_first_caller_does_not_cancel_others(fake_completion):
+    """먼저 호출한 요청이 취소되어도 같은 요청을 기다리던 다른 호출자는 결과를 받는지 확인"""
+    calls, release = fake_completion
+
+    async def scenario():
+        first = asyncio.create_task(chatgpt_service.call_chatgpt("sys", "user"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(chatgpt_service.call_chatgpt("sys", "user"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        release.set()
+        return first.cancelled(), await second
+
+    first_cancelled, second_result = asyncio.run(scenario())
+    assert first_cancelled
+    assert second_result == "응답"
+    assert len(calls) == 1
@@ -0,0 +1,58 @@
+"""테스트: ChatGPT Batch 결과의 작업별 오류 보고"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("config.settings")
+pytest.importorskip("models.prompt_settings")
+
+from services import chatgpt_service  # noqa: E402
+
+
+def _jsonl(rows: list[dict]) -> SimpleNamespace:
+    return SimpleNamespace(text="\n".join(json.dumps(row) for row in rows) + "\n")
+
+
+class _FakeClient:
+    def __init__(self, output_rows: list[dict], error_rows: list[dict]):
+        batch = SimpleNamespace(status="completed", output_file_id="out", error_file_id="err")
+        files = {"out": _jsonl(output_rows), "err": _jsonl(error_rows)}
+
+        async def retrieve(batch_id):
+            return batch
+
+        async def content(file_id):
+            return files[file_id]
+
+        self.batches = SimpleNamespace(retrieve=retrieve)
+        self.files = SimpleNamespace(content=content)
+
+
+def test_poll_batch_reports_failed_jobs(monkeypatch):
+    """non-200 행과 에러 파일의 행이 누락되지 않고 오류로 보고되는지 확인"""
+    output_rows = [
+        {
+            "custom_id": "job-0",
+            "response": {"status_code": 200, "body": {"choices": [{"message": {"content": "결과"}}]}},
+        },
+        {
+            "custom_id": "job-1",
+            "response": {"status_code": 429, "body": {"error": {"message": "rate limited"}}},
+        },
+    ]
+    error_rows = [{"custom_id": "job-2", "response": None, "error": {"code": "x", "message": "invalid request"}}]
+    monkeypatch.setattr(chatgpt_service, "_get_client", lambda: _FakeClient(output_rows, error_rows))
+
+    async def scenario():
+        return [result async for result in chatgpt_service.poll_batch("batch-1", poll_interval_sec=0)]
+
+    results = asyncio.run(scenario())
+    assert results == [
+        ("job-0", "결과", None),
+        ("job-1", None, "rate limited"),
+        ("job-2", None, "invalid request"),
+    ]
@@ -0,0 +1,38 @@
+"""테스트: 업로드 청크 저장과 용량 초과 처리"""
+
+from web.routers import files
+
+
+def test_oversized_upload_keeps_existing_file(client, tmp_vault, monkeypatch):
+    """용량을 넘는 업로드는 413을 반환하고, 임시 파일을 남기지 않으며 기존 파일을 보존하는지 확인"""
+    monkeypatch.setattr(files, "MAX_UPLOAD_BYTES", 1024)
+    monkeypatch.setattr(files, "UPLOAD_CHUNK_BYTES", 256)
+    target = tmp_vault / "Notes" / "hello.md"
+    original = target.read_bytes()
+
+    res = client.post(
+        "/api/upload",
+        files={"file": ("hello.md", b"x" * 1025, "text/markdown")},
+        data={"dest_path": "Notes"},
+    )
+
+    assert res.status_code == 413
+    assert not (tmp_vault / "Notes" / ".hello.md.upload").exists()
+    assert target.read_bytes() == original
+
+
+def test_upload_within_limit_replaces_file(client, tmp_vault, monkeypatch):
+    """용량 이내 업로드는 여러 청크로 나뉘어도 전체 내용이 저장되는지 확인"""
+    monkeypatch.setattr(files, "MAX_UPLOAD_BYTES", 1024)
+    monkeypatch.setattr(files, "UPLOAD_CHUNK_BYTES", 256)
+    payload = b"y" * 1024
+
+    res = client.post(
+        "/api/upload",
+        files={"file": ("hello.md", payload, "text/markdown")},
+        data={"dest_path": "Notes"},
+    )
+
+    assert res.status_code == 200
+    assert (tmp_vault / "Notes" / "hello.md").read_bytes() == payload
+    assert not (tmp_vault / "Notes" / ".hello.md.upload").exists()
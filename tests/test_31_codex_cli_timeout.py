@@ -0,0 +1,34 @@
+"""테스트: Codex CLI 실행 시간 초과 처리"""
+
+import asyncio
+import sys
+
+import pytest
+
+pytest.importorskip("config.settings")
+
+from services import codex_cli_service  # noqa: E402
+
+
+def test_generate_with_codex_cli_timeout_kills_process(monkeypatch):
+    """시간 초과 시 RuntimeError를 내고 자식 프로세스를 종료/회수하는지 확인"""
+    spawned = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def recording_exec(*args, **kwargs):
+        proc = await real_exec(*args, **kwargs)
+        spawned.append(proc)
+        return proc
+
+    monkeypatch.setattr(
+        codex_cli_service,
+        "_resolve_command",
+        lambda: [sys.executable, "-c", "import time; time.sleep(5)"],
+    )
+    monkeypatch.setattr(codex_cli_service.asyncio, "create_subprocess_exec", recording_exec)
+
+    with pytest.raises(RuntimeError, match="시간 초과"):
+        asyncio.run(codex_cli_service.generate_with_codex_cli("회의록", "요약", timeout_sec=1))
+
+    assert len(spawned) == 1
+    assert spawned[0].returncode is not None
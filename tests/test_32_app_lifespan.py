@@ -0,0 +1,22 @@
+"""테스트: 앱 종료 시 공유 OpenAI 클라이언트 정리"""
+
+import sys
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+
+def test_lifespan_closes_loaded_chatgpt_client(tmp_vault, monkeypatch):
+    """chatgpt_service가 로드되어 있으면 앱 종료 시 close_client를 호출하는지 확인"""
+    closed: list[bool] = []
+
+    async def fake_close_client() -> None:
+        closed.append(True)
+
+    monkeypatch.setitem(sys.modules, "services.chatgpt_service", SimpleNamespace(close_client=fake_close_client))
+    monkeypatch.setattr("web.routers.ai.get_vault_path", lambda: tmp_vault)
+    from web.main import app
+
+    with TestClient(app):
+        assert closed == []
+    assert closed == [True]
@@ -0,0 +1,56 @@
+"""테스트: ChatGPT 스트리밍의 동시 실행 슬롯 점유"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("config.settings")
+pytest.importorskip("models.prompt_settings")
+
+from services import chatgpt_service  # noqa: E402
+
+
+class _FakeStream:
+    def __init__(self, deltas: list[str]):
+        self._deltas = deltas
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for delta in self._deltas:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+    async def close(self):
+        self.closed = True
+
+
+def test_stream_releases_slot_while_consumer_is_suspended(monkeypatch):
+    """소비자가 청크를 받고 멈춰 있는 동안 세마포어 슬롯을 놓고, 중단 시 스트림을 닫는지 확인"""
+    stream = _FakeStream(["가", "나", "다"])
+
+    async def create(**kwargs):
+        return stream
+
+    async def no_cache(key):
+        return None
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(chatgpt_service, "_get_client", lambda: client)
+    monkeypatch.setattr(chatgpt_service, "_cache_get", no_cache)
+
+    async def scenario():
+        monkeypatch.setattr(chatgpt_service, "_OPENAI_SEM", asyncio.Semaphore(1))
+        gen = chatgpt_service.stream_chatgpt("sys", "user")
+        first = await anext(gen)
+        slot_free = not chatgpt_service._OPENAI_SEM.locked()
+        await gen.aclose()
+        return first, slot_free
+
+    first, slot_free = asyncio.run(scenario())
+    assert first == "가"
+    assert slot_free
+    assert stream.closed
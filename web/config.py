@@ -1,7 +1,14 @@
+import functools
 import json
 import os
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson 휠이 없는 환경에서는 표준 json으로 동작
+    orjson = None
+
 DATA_DIR = Path(__file__).parent.parent / "data"
 CONFIG_FILE = DATA_DIR / "viewer_config.json"
 
@@ -21,24 +28,69 @@ DEFAULT_NLM_ENABLED = os.environ.get("NLM_ENABLED", "false").strip().lower() in
 }
 
 
+def _json_loads(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _json_dumps(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# 파싱된 설정을 파일 mtime 기준으로 캐시해, 파일이 바뀌었을 때만 다시 읽는다.
+_cache: dict = {}
+_cache_mtime_ns: int = -1
+_cache_lock = threading.Lock()
+
+
+def _current() -> dict:
+    """캐시된 설정 dict를 복사 없이 반환한다. 읽기 전용으로만 쓸 것."""
+    global _cache, _cache_mtime_ns
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
+        return {}
+    with _cache_lock:
+        if st.st_mtime_ns != _cache_mtime_ns:
+            try:
+                _cache = _json_loads(CONFIG_FILE.read_bytes())
+            except Exception:
+                _cache = {}
+            _cache_mtime_ns = st.st_mtime_ns
+        return _cache
+
+
 def _load() -> dict:
-    if CONFIG_FILE.exists():
-        try:
-            return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    return {}
+    return dict(_current())
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_vault(raw: str) -> Path:
+    # 설정 값이 바뀌지 않는 한 expanduser/resolve(경로 구성요소마다 lstat)를 반복하지 않는다.
+    # 원본 문자열이 키이므로 새 경로를 저장하면 자연히 캐시 미스가 된다.
+    return Path(raw).expanduser().resolve()
 
 
 def _save(data: dict) -> None:
+    global _cache, _cache_mtime_ns
+    if data == _current():
+        return
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    with _cache_lock:
+        # 임시 파일에 쓴 뒤 rename해서, 쓰기 도중 중단되어도 기존 설정이 깨지지 않게 한다.
+        tmp_path = CONFIG_FILE.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_json_dumps(data))
+        os.replace(tmp_path, CONFIG_FILE)
+        _cache = dict(data)
+        _cache_mtime_ns = CONFIG_FILE.stat().st_mtime_ns
 
 
 def get_vault_path() -> Path:
-    data = _load()
-    raw = data.get("vault_path") or DEFAULT_VAULT
-    return Path(raw).expanduser().resolve()
+    raw = _current().get("vault_path") or DEFAULT_VAULT
+    return _resolve_vault(raw)
 
 
 def set_vault_path(path: str) -> Path:
@@ -50,8 +102,7 @@ def set_vault_path(path: str) -> Path:
 
 
 def get_issue_folder() -> str:
-    data = _load()
-    return data.get("issue_folder") or DEFAULT_ISSUE_FOLDER
+    return _current().get("issue_folder") or DEFAULT_ISSUE_FOLDER
 
 
 def set_issue_folder(folder: str) -> str:
@@ -66,8 +117,7 @@ def set_issue_folder(folder: str) -> str:
 
 
 def get_auto_watch_enabled() -> bool:
-    data = _load()
-    raw = data.get("auto_watch_enabled")
+    raw = _current().get("auto_watch_enabled")
     if raw is None:
         return DEFAULT_AUTO_WATCH_ENABLED
     if isinstance(raw, str):
@@ -83,8 +133,7 @@ def set_auto_watch_enabled(enabled: bool) -> bool:
 
 
 def get_nlm_enabled() -> bool:
-    data = _load()
-    raw = data.get("nlm_enabled")
+    raw = _current().get("nlm_enabled")
     if raw is None:
         return DEFAULT_NLM_ENABLED
     if isinstance(raw, str):
@@ -23,6 +23,10 @@ async def lifespan(app: FastAPI):
         yield
     finally:
         await ai_router.stop_auto_watch()
+        # services 의존성은 선택 사항이므로, 실제로 로드되어 연결 풀을 만든 경우에만 닫는다.
+        chatgpt_service = sys.modules.get("services.chatgpt_service")
+        if chatgpt_service is not None:
+            await chatgpt_service.close_client()
 
 
 app = FastAPI(title="Obsidian Vault Viewer", version="1.0.0", lifespan=lifespan)
@@ -39,7 +43,7 @@ app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 
 @app.get("/")
-def index():
+async def index():
     return FileResponse(os.path.join(STATIC_DIR, "index.html"))
 
 
@@ -0,0 +1,9 @@
+from pathlib import Path
+
+
+def safe_resolve(vault: Path, relative_path: str) -> Path:
+    """볼트 기준 상대 경로를 resolve하고, 결과가 볼트 밖이면 PermissionError를 낸다."""
+    resolved = (vault / relative_path).resolve()
+    if not resolved.is_relative_to(vault):
+        raise PermissionError("경로 접근이 허용되지 않습니다.")
+    return resolved
@@ -0,0 +1,18 @@
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # orjson 휠이 없는 환경에서는 표준 json으로 동작
+    orjson = None
+
+
+def json_response(obj: Any, status_code: int = 200) -> Response:
+    """jsonable_encoder를 거치지 않고 미리 직렬화한 JSON 응답을 만든다. dict/list/str/int 등 기본 타입만 넣을 것."""
+    if orjson is not None:
+        body = orjson.dumps(obj)
+    else:
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    return Response(content=body, status_code=status_code, media_type="application/json")
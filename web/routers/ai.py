@@ -1,7 +1,10 @@
 import asyncio
+import codecs
 import logging
 import os
 import re
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -10,6 +13,7 @@ import traceback
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from watchfiles import Change, awatch
 
 from web.config import (
     get_auto_watch_enabled,
@@ -18,6 +22,8 @@ from web.config import (
     get_vault_path,
     set_auto_watch_enabled,
 )
+from web.paths import safe_resolve
+from web.responses import json_response
 
 logger = logging.getLogger("ai")
 
@@ -43,10 +49,15 @@ AUTO_WATCH_EXCLUDED_DIR_NAMES = {".git", "__pycache__", "issues", "Slides"}
 AUTO_WATCH_POLL_SEC = 2.0
 AUTO_WATCH_SETTLE_ATTEMPTS = 3
 AUTO_WATCH_SETTLE_INTERVAL_SEC = 0.5
+STREAM_READ_CHUNK_BYTES = 65536
+SUBPROCESS_STREAM_LIMIT = 1 << 20
+SSE_FLUSH_BYTES = 8192
+SSE_FLUSH_INTERVAL_SEC = 0.025
 
 _AUTO_WATCH_STATE: dict[str, Any] = {
     "enabled": get_auto_watch_enabled(),
     "task": None,
+    "stop_event": None,
     "known_files": set(),
     "vault_path": "",
     "processed_count": 0,
@@ -64,6 +75,9 @@ _AUTO_WATCH_STATE: dict[str, Any] = {
     "slides_generated_count": 0,
 }
 _AUTO_WATCH_LOCK = asyncio.Lock()
+# watcher가 재시작(볼트 변경/재시드)되어도 진행 중인 파일 처리는 이어지도록 모듈 단위로 보관한다.
+_AUTO_WATCH_TASKS: set[asyncio.Task] = set()
+_AUTO_WATCH_SEM = asyncio.Semaphore(max(1, int(os.getenv("AIMF_AUTO_WATCH_PAR", "2"))))
 
 
 def _resolve_command(engine: str) -> list[str]:
@@ -76,81 +90,207 @@ def _now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
-def _safe_resolve_in_vault(vault: Path, relative_path: str) -> Path:
-    resolved = (vault / relative_path).resolve()
+def _watch_excluded_dir_names() -> set[str]:
+    excluded = {name.lower() for name in AUTO_WATCH_EXCLUDED_DIR_NAMES}
+    issue_folder = get_issue_folder().strip().lower()
+    if issue_folder:
+        excluded.add(issue_folder)
+    return excluded
+
+
+def _watch_rel_path(vault: Path, file_path: str, excluded: set[str]) -> str | None:
+    """auto-watch 대상이면 볼트 기준 상대 경로를, 아니면 None을 반환한다."""
+    try:
+        rel_path = Path(file_path).relative_to(vault)
+    except ValueError:
+        return None
+    filename = rel_path.name
+    if filename.startswith(".") or filename.startswith("_source_"):
+        return None
+    if rel_path.suffix.lower() not in AUTO_WATCH_EXTENSIONS:
+        return None
+    for part in rel_path.parts[:-1]:
+        if part.startswith(".") or part.lower() in excluded:
+            return None
+    # 초기 스캔 결과와 같은 문자열 객체를 공유하도록 intern해 known_files 멤버십 비교를 싸게 한다.
+    return sys.intern(str(rel_path))
+
+
+def _watch_rel_dir(vault: Path, dir_path: str, excluded: set[str]) -> str | None:
+    """dir_path가 감시 대상 폴더(숨김/제외 폴더가 아닌 볼트 하위 폴더)면 볼트 기준 상대 경로를 반환한다."""
+    try:
+        rel_path = Path(dir_path).relative_to(vault)
+    except ValueError:
+        return None
+    if not rel_path.parts:
+        return None
+    for part in rel_path.parts:
+        if part.startswith(".") or part.lower() in excluded:
+            return None
+    return str(rel_path)
+
+
+_AUTO_WATCH_SUFFIXES = frozenset(ext.lstrip(".") for ext in AUTO_WATCH_EXTENSIONS)
+
+
+# 디렉터리 절대 경로 -> (st_mtime_ns, 직속 후보 파일 상대 경로들, 하위 디렉터리 경로들).
+# 디렉터리 mtime은 직속 엔트리가 추가/삭제/이름변경될 때만 바뀌므로, mtime이 같으면 readdir를 건너뛰고
+# 캐시된 직속 파일을 그대로 쓰되 하위 디렉터리는 계속 stat해서 확인한다.
+_DIR_CACHE: dict[str, tuple[int, list[str], list[str]]] = {}
+_DIR_CACHE_KEY: list[Any] = [None]
+
+
+def _scan_iter(dirpath: str, vault_len: int, excluded: set[str]):
+    """os.scandir로 dirpath 하위를 재귀 순회하며 auto-watch 후보의 볼트 기준 상대 경로를 yield한다."""
     try:
-        resolved.relative_to(vault)
-    except ValueError as exc:
-        raise PermissionError("경로 접근이 허용되지 않습니다.") from exc
-    return resolved
+        mtime_ns = os.stat(dirpath).st_mtime_ns
+    except OSError:
+        _DIR_CACHE.pop(dirpath, None)
+        return
+
+    cached = _DIR_CACHE.get(dirpath)
+    if cached is not None and cached[0] == mtime_ns:
+        _, files, subdirs = cached
+    else:
+        files = []
+        subdirs = []
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if name.lower() not in excluded:
+                        subdirs.append(entry.path)
+                    continue
+                if name.startswith("_source_"):
+                    continue
+                _, dot, ext = name.rpartition(".")
+                if dot and ext.lower() in _AUTO_WATCH_SUFFIXES:
+                    files.append(sys.intern(entry.path[vault_len + 1:]))
+        if cached is not None:
+            current_subdirs = set(subdirs)
+            for subdir in cached[2]:
+                if subdir not in current_subdirs:
+                    _forget_cached_dir(subdir)
+        _DIR_CACHE[dirpath] = (mtime_ns, files, subdirs)
+
+    yield from files
+    for subdir in subdirs:
+        yield from _scan_iter(subdir, vault_len, excluded)
+
+
+def _forget_cached_dir(dirpath: str) -> None:
+    """사라진 폴더와 그 하위 폴더의 _DIR_CACHE 항목을 지운다."""
+    cached = _DIR_CACHE.pop(dirpath, None)
+    if cached is not None:
+        for subdir in cached[2]:
+            _forget_cached_dir(subdir)
 
 
 def _scan_watch_candidates(vault: Path) -> set[str]:
     if not vault.exists() or not vault.is_dir():
         return set()
 
-    excluded = {name.lower() for name in AUTO_WATCH_EXCLUDED_DIR_NAMES}
-    issue_folder = get_issue_folder().strip().lower()
-    if issue_folder:
-        excluded.add(issue_folder)
+    vault_text = str(vault)
+    excluded = _watch_excluded_dir_names()
+    cache_key = (vault_text, frozenset(excluded))
+    if _DIR_CACHE_KEY[0] != cache_key:
+        _DIR_CACHE.clear()
+        _DIR_CACHE_KEY[0] = cache_key
+    return set(_scan_iter(vault_text, len(vault_text), excluded))
 
-    discovered: set[str] = set()
-    for root, dirs, files in os.walk(vault):
-        dirs[:] = [d for d in dirs if not d.startswith(".") and d.lower() not in excluded]
 
-        root_path = Path(root)
-        for filename in files:
-            if filename.startswith(".") or filename.startswith("_source_"):
-                continue
-            if Path(filename).suffix.lower() not in AUTO_WATCH_EXTENSIONS:
-                continue
+def _list_md_names(dirpath: Path) -> list[str]:
+    with os.scandir(dirpath) as entries:
+        return [entry.name for entry in entries if entry.name.endswith(".md") and entry.is_file()]
 
-            file_path = root_path / filename
-            try:
-                rel_path = file_path.relative_to(vault)
-            except ValueError:
-                continue
 
-            if any(part.lower() in excluded for part in rel_path.parts[:-1]):
-                continue
+# 템플릿 경로 -> (st_mtime_ns, 디코딩된 내용)
+_TEMPLATE_CACHE: dict[str, tuple[int, str]] = {}
+
+
+def _read_template(template_path: Path) -> str | None:
+    """템플릿 파일 내용을 mtime 기준으로 캐시해 반환한다. 파일이 없으면 None."""
+    key = str(template_path)
+    try:
+        mtime_ns = template_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _TEMPLATE_CACHE.pop(key, None)
+        return None
+
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    text = template_path.read_text(encoding="utf-8", errors="replace")
+    _TEMPLATE_CACHE[key] = (mtime_ns, text)
+    return text
+
 
-            discovered.add(str(rel_path))
-    return discovered
+# (볼트, account) -> (템플릿 mtime_ns, Issues 폴더 mtime_ns, 템플릿+Issues 목록 부분). 없는 경로의 mtime은 -1.
+# 파일마다 달라지는 [파일 정보] 헤더는 캐시하지 않으므로 항목 수는 account 수로 제한된다.
+_CONTEXT_CACHE: dict[tuple[str, str], tuple[int, int, str]] = {}
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
 
 
 def _build_context(vault: Path, file_path: str) -> str:
     """파일 경로로부터 account, 템플릿, 기존 이슈 목록을 조합해 컨텍스트 문자열을 반환한다."""
-    parts: list[str] = []
     path_parts = Path(file_path).parts
-
     # account = 볼트 루트 바로 아래 폴더명 (파일이 루트에 있으면 "루트")
     account = path_parts[0] if len(path_parts) > 1 else ""
-    parts.append(
+    header = (
         f"[파일 정보]\n"
         f"- 파일 경로: {file_path}\n"
         f"- Account(상위 폴더): {account or '(볼트 루트)'}"
     )
+    account_context = _build_account_context(vault, account)
+    return f"{header}\n\n{account_context}" if account_context else header
 
-    # Template_Issue.md 내용 주입
+
+def _build_account_context(vault: Path, account: str) -> str:
     template_path = vault / "_Templates" / "Template_Issue.md"
-    if template_path.exists():
-        tmpl = template_path.read_text(encoding="utf-8", errors="replace")
+    issues_dir = vault / account / "Issues" if account else None
+
+    # 같은 account의 파일을 반복 요약할 때 템플릿/Issues 폴더가 그대로면 다시 만들지 않는다.
+    key = (str(vault), account)
+    template_mtime = _mtime_ns(template_path)
+    issues_mtime = _mtime_ns(issues_dir) if issues_dir is not None else -1
+    cached = _CONTEXT_CACHE.get(key)
+    if cached is not None and cached[0] == template_mtime and cached[1] == issues_mtime:
+        return cached[2]
+
+    parts: list[str] = []
+
+    # Template_Issue.md 내용 주입
+    tmpl = _read_template(template_path)
+    if tmpl is not None:
         parts.append(f"[Template_Issue.md 내용 — 이 포맷에 맞춰 작성]\n{tmpl}")
 
     # account 하위 Issues 폴더의 기존 파일 목록 (번호 채번 참고용)
-    if account:
-        issues_dir = vault / account / "Issues"
-        if issues_dir.exists():
-            issue_files = sorted(f.name for f in issues_dir.glob("*.md"))
-            if issue_files:
-                file_list = "\n".join(f"- {f}" for f in issue_files)
-                parts.append(
-                    f"[{account}/Issues/ 폴더의 기존 파일 목록 — 이름 규칙 참고]\n{file_list}"
-                )
-            else:
-                parts.append(f"[{account}/Issues/ 폴더]: 비어 있음 (첫 번째 이슈로 -001 사용)")
+    if issues_dir is not None and issues_mtime != -1 and issues_dir.is_dir():
+        issue_files = sorted(_list_md_names(issues_dir))
+        if issue_files:
+            file_list = "\n".join(f"- {f}" for f in issue_files)
+            parts.append(
+                f"[{account}/Issues/ 폴더의 기존 파일 목록 — 이름 규칙 참고]\n{file_list}"
+            )
+        else:
+            parts.append(f"[{account}/Issues/ 폴더]: 비어 있음 (첫 번째 이슈로 -001 사용)")
+
+    account_context = "\n\n".join(parts)
+    _CONTEXT_CACHE[key] = (template_mtime, issues_mtime, account_context)
+    return account_context
 
-    return "\n\n".join(parts)
+
+def _read_text_if_exists(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="replace") if path.exists() else ""
 
 
 def _build_input(content: str, prompt: str, context: str = "") -> str:
@@ -161,13 +301,19 @@ def _build_input(content: str, prompt: str, context: str = "") -> str:
     return "\n\n".join(parts) + "\n"
 
 
+_ISSUE_PATTERNS = (
+    re.compile(r"^[^_]+_(\d+)_"),   # 새 규칙: folder_001_title
+    re.compile(r"^[^-]+-(\d+)_"),   # 기존 규칙: CODE-001_title
+)
+_TITLE_RE = re.compile(r"^\s*title\s*:\s*(.+?)\s*$", re.IGNORECASE)
+_FN_BAD = re.compile(r"[\\/:*?\"<>|]+")
+_FN_WS = re.compile(r"\s+")
+_FN_US = re.compile(r"_+")
+
+
 def _extract_issue_index(stem: str) -> int | None:
-    patterns = [
-        r"^[^_]+_(\d+)_",   # 새 규칙: folder_001_title
-        r"^[^-]+-(\d+)_",   # 기존 규칙: CODE-001_title
-    ]
-    for pattern in patterns:
-        match = re.match(pattern, stem)
+    for pattern in _ISSUE_PATTERNS:
+        match = pattern.match(stem)
         if match:
             try:
                 return int(match.group(1))
@@ -188,7 +334,7 @@ def _extract_title_from_ai_output(ai_output: str, fallback: str) -> str:
         for line in lines[1:120]:
             if line.strip() == "---":
                 break
-            match = re.match(r"^\s*title\s*:\s*(.+?)\s*$", line, flags=re.IGNORECASE)
+            match = _TITLE_RE.match(line)
             if match:
                 value = match.group(1).strip().strip("\"'")
                 if value:
@@ -210,15 +356,35 @@ def _sanitize_filename_token(value: str, fallback: str) -> str:
     if not raw:
         raw = fallback
 
-    cleaned = re.sub(r"[\\/:*?\"<>|]+", "", raw)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    cleaned = _FN_BAD.sub("", raw)
+    cleaned = _FN_WS.sub(" ", cleaned).strip()
     cleaned = cleaned.replace(" ", "_")
-    cleaned = re.sub(r"_+", "_", cleaned).strip("._")
+    cleaned = _FN_US.sub("_", cleaned).strip("._")
     if not cleaned:
         cleaned = fallback
     return cleaned[:80]
 
 
+# Issues 폴더 -> (st_mtime_ns, 다음 이슈 번호). 폴더 mtime이 그대로면 파일 목록을 다시 읽지 않는다.
+_NEXT_ISSUE_INDEX: dict[Path, tuple[int, int]] = {}
+_ISSUE_INDEX_LOCK = threading.Lock()
+
+
+def _next_issue_index(issue_dir: Path, rescan: bool = False) -> int:
+    mtime_ns = issue_dir.stat().st_mtime_ns
+    cached = _NEXT_ISSUE_INDEX.get(issue_dir)
+    if not rescan and cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    next_num = 1
+    for name in _list_md_names(issue_dir):
+        index = _extract_issue_index(name[:-3])
+        if index is not None:
+            next_num = max(next_num, index + 1)
+    _NEXT_ISSUE_INDEX[issue_dir] = (mtime_ns, next_num)
+    return next_num
+
+
 def _save_ai_output(vault: Path, source_path: str, source_abs: Path, ai_output: str) -> dict[str, str]:
     path_parts = Path(source_path).parts
     account = path_parts[0] if len(path_parts) > 1 else ""
@@ -228,20 +394,24 @@ def _save_ai_output(vault: Path, source_path: str, source_abs: Path, ai_output:
         issue_dir = vault / get_issue_folder()
     issue_dir.mkdir(parents=True, exist_ok=True)
 
-    existing = sorted(f.stem for f in issue_dir.glob("*.md"))
-    next_num = 1
-    for stem in existing:
-        index = _extract_issue_index(stem)
-        if index is not None:
-            next_num = max(next_num, index + 1)
-
     folder_token = _sanitize_filename_token(account or issue_dir.name or "issue", "issue")
     title_raw = _extract_title_from_ai_output(ai_output, source_abs.stem)
     title_token = _sanitize_filename_token(title_raw, source_abs.stem or "untitled")
 
-    out_name = f"{folder_token}_{next_num:03d}_{title_token}.md"
-    out_path = issue_dir / out_name
-    out_path.write_text(ai_output, encoding="utf-8")
+    # 저장은 스레드에서 동시에 실행될 수 있으므로 채번~파일 생성을 한 번에 묶는다.
+    with _ISSUE_INDEX_LOCK:
+        next_num = _next_issue_index(issue_dir)
+        while True:
+            out_name = f"{folder_token}_{next_num:03d}_{title_token}.md"
+            out_path = issue_dir / out_name
+            try:
+                with open(out_path, "x", encoding="utf-8") as fh:
+                    fh.write(ai_output)
+                break
+            except FileExistsError:
+                # 다른 프로세스/수동 편집으로 번호가 밀렸으면 폴더를 다시 읽어 채번한다.
+                next_num = max(_next_issue_index(issue_dir, rescan=True), next_num + 1)
+        _NEXT_ISSUE_INDEX[issue_dir] = (issue_dir.stat().st_mtime_ns, next_num + 1)
     return {"saved_path": str(out_path.relative_to(vault)), "name": out_name}
 
 
@@ -254,6 +424,7 @@ async def _run_subprocess_once(command: list[str], full_input: str, timeout_sec:
             stderr=asyncio.subprocess.PIPE,
             cwd=cwd,
             env=_CLEAN_ENV,
+            limit=SUBPROCESS_STREAM_LIMIT,
         )
     except FileNotFoundError as exc:
         raise RuntimeError(f"`{command[0]}` 명령어를 찾을 수 없습니다.") from exc
@@ -287,23 +458,34 @@ async def summarize_file_to_issue(
     timeout_sec: int = 600,
 ) -> dict[str, str]:
     vault = get_vault_path()
-    file_abs = _safe_resolve_in_vault(vault, file_path)
+    file_abs = safe_resolve(vault, file_path)
 
     if not file_abs.exists() or not file_abs.is_file():
         raise FileNotFoundError("파일을 찾을 수 없습니다.")
 
-    content = file_abs.read_text(encoding="utf-8", errors="replace")
+    content = await asyncio.to_thread(file_abs.read_text, encoding="utf-8", errors="replace")
     command = _resolve_command(engine.lower())
-    context = _build_context(vault, file_path)
+    context = await asyncio.to_thread(_build_context, vault, file_path)
     full_input = _build_input(content, prompt, context)
     ai_output = await _run_subprocess_once(command, full_input, timeout_sec, cwd=str(vault))
-    return _save_ai_output(vault, file_path, file_abs, ai_output)
+    return await asyncio.to_thread(_save_ai_output, vault, file_path, file_abs, ai_output)
 
 
-def _sse(data: str, event: str = "message") -> str:
-    lines = data.replace("\r\n", "\n").split("\n")
-    payload = "\n".join(f"data: {line}" for line in lines)
-    return f"event: {event}\n{payload}\n\n"
+_SSE_EVENT = b"event: "
+_SSE_DATA = b"data: "
+_SSE_NL = b"\n"
+
+
+def _sse(data: str, event: str = "message") -> bytes:
+    out = bytearray(_SSE_EVENT)
+    out += event.encode("utf-8")
+    out += _SSE_NL
+    for line in data.encode("utf-8").replace(b"\r\n", b"\n").split(b"\n"):
+        out += _SSE_DATA
+        out += line
+        out += _SSE_NL
+    out += _SSE_NL
+    return bytes(out)
 
 
 async def _stream_subprocess(command: list[str], full_input: str, timeout_sec: int, cwd: str | None = None):
@@ -316,6 +498,7 @@ async def _stream_subprocess(command: list[str], full_input: str, timeout_sec: i
             stderr=asyncio.subprocess.PIPE,
             cwd=cwd,
             env=_CLEAN_ENV,
+            limit=SUBPROCESS_STREAM_LIMIT,
         )
     except FileNotFoundError:
         yield _sse(f"오류: `{command[0]}` 명령어를 찾을 수 없습니다. 설치 및 PATH를 확인해 주세요.", event="error")
@@ -327,34 +510,59 @@ async def _stream_subprocess(command: list[str], full_input: str, timeout_sec: i
 
     stdout_chunks: list[str] = []
     stderr_chunks: list[str] = []
-    queue: asyncio.Queue = asyncio.Queue()
-
-    async def _pump(stream, channel: str):
-        while True:
-            line = await stream.readline()
-            if not line:
-                break
-            await queue.put((channel, line.decode("utf-8", errors="replace")))
-        await queue.put((channel, None))  # EOF sentinel
-
-    tasks = [
-        asyncio.create_task(_pump(process.stdout, "stdout")),
-        asyncio.create_task(_pump(process.stderr, "stderr")),
-    ]
+    decoders = {
+        process.stdout: codecs.getincrementaldecoder("utf-8")(errors="replace"),
+        process.stderr: codecs.getincrementaldecoder("utf-8")(errors="replace"),
+    }
+    reads: dict[asyncio.Task, asyncio.StreamReader] = {
+        asyncio.ensure_future(stream.read(STREAM_READ_CHUNK_BYTES)): stream for stream in decoders
+    }
 
-    eof_count = 0
+    # stdout 조각을 모아 SSE_FLUSH_BYTES 이상 쌓이거나, 가장 먼저 버퍼에 들어온 조각이
+    # SSE_FLUSH_INTERVAL_SEC만큼 기다렸으면 한 프레임으로 내보낸다. 출력이 계속 들어와도 지연은 이 값으로 제한된다.
+    loop = asyncio.get_running_loop()
+    buf: list[str] = []
+    buf_bytes = 0
+    first_buffered_at = 0.0
     try:
         async with asyncio.timeout(timeout_sec):
-            while eof_count < 2:
-                channel, text = await queue.get()
-                if text is None:
-                    eof_count += 1
-                    continue
-                if channel == "stdout":
-                    stdout_chunks.append(text)
-                    yield _sse(text, event="chunk")
-                else:
-                    stderr_chunks.append(text)
+            while reads:
+                wait_timeout = None
+                if buf:
+                    wait_timeout = max(0.0, first_buffered_at + SSE_FLUSH_INTERVAL_SEC - loop.time())
+                done, _ = await asyncio.wait(
+                    reads,
+                    timeout=wait_timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    stream = reads.pop(task)
+                    data = task.result()
+                    text = decoders[stream].decode(data, final=not data)
+                    if data:
+                        reads[asyncio.ensure_future(stream.read(STREAM_READ_CHUNK_BYTES))] = stream
+                    if not text:
+                        continue
+                    if stream is process.stdout:
+                        stdout_chunks.append(text)
+                        if not buf:
+                            first_buffered_at = loop.time()
+                        buf.append(text)
+                        buf_bytes += len(text.encode("utf-8"))
+                    else:
+                        stderr_chunks.append(text)
+
+                if buf and (
+                    buf_bytes >= SSE_FLUSH_BYTES
+                    or loop.time() - first_buffered_at >= SSE_FLUSH_INTERVAL_SEC
+                ):
+                    yield _sse("".join(buf), event="chunk")
+                    buf.clear()
+                    buf_bytes = 0
+            if buf:
+                yield _sse("".join(buf), event="chunk")
+                buf.clear()
             await process.wait()
     except TimeoutError:
         process.kill()
@@ -362,9 +570,9 @@ async def _stream_subprocess(command: list[str], full_input: str, timeout_sec: i
         yield _sse(f"오류: 실행 시간 초과({timeout_sec}초)", event="error")
         return
     finally:
-        for task in tasks:
+        for task in reads:
             task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*reads, return_exceptions=True)
 
     if process.returncode != 0:
         stderr = "".join(stderr_chunks).strip()
@@ -465,7 +673,7 @@ async def _trigger_slide_generation(
 
 async def _handle_auto_watch_file(file_path: str) -> None:
     vault = get_vault_path()
-    file_abs = _safe_resolve_in_vault(vault, file_path)
+    file_abs = safe_resolve(vault, file_path)
     if not file_abs.exists() or not file_abs.is_file():
         return
 
@@ -495,7 +703,7 @@ async def _handle_auto_watch_file(file_path: str) -> None:
             if saved_path:
                 vault = get_vault_path()
                 issue_abs = vault / saved_path
-                issue_content = issue_abs.read_text(encoding="utf-8", errors="replace") if issue_abs.exists() else ""
+                issue_content = await asyncio.to_thread(_read_text_if_exists, issue_abs)
                 issue_md_name = Path(saved_path).name
                 issue_title = Path(saved_path).stem
                 if issue_content:
@@ -507,46 +715,40 @@ async def _handle_auto_watch_file(file_path: str) -> None:
                     )
 
 
+async def _process_auto_watch_file(rel_path: str) -> None:
+    # AI CLI 실행이 대부분 대기 시간이므로 여러 새 파일을 동시에 처리하되, 동시 실행 수는 세마포어로 제한한다.
+    async with _AUTO_WATCH_SEM:
+        async with _AUTO_WATCH_LOCK:
+            if not _AUTO_WATCH_STATE["enabled"]:
+                return
+        try:
+            await _handle_auto_watch_file(rel_path)
+        except Exception as exc:  # noqa: BLE001 - watcher should not crash loop
+            await _set_auto_watch_error(f"{rel_path}: {exc}")
+
+
+def _spawn_auto_watch_task(rel_path: str) -> None:
+    task = asyncio.create_task(_process_auto_watch_file(rel_path), name=f"auto-watch-{rel_path}")
+    _AUTO_WATCH_TASKS.add(task)
+    task.add_done_callback(_AUTO_WATCH_TASKS.discard)
+
+
 async def _auto_watch_loop() -> None:
     while True:
         try:
-            await asyncio.sleep(AUTO_WATCH_POLL_SEC)
-
             async with _AUTO_WATCH_LOCK:
                 enabled = bool(_AUTO_WATCH_STATE["enabled"])
             if not enabled:
+                await asyncio.sleep(AUTO_WATCH_POLL_SEC)
                 continue
 
             vault = get_vault_path()
             if not vault.exists() or not vault.is_dir():
                 await _set_auto_watch_error(f"볼트 경로를 찾을 수 없습니다: {vault}")
+                await asyncio.sleep(AUTO_WATCH_POLL_SEC)
                 continue
 
-            current_files = _scan_watch_candidates(vault)
-            vault_text = str(vault)
-
-            async with _AUTO_WATCH_LOCK:
-                known_files = set(_AUTO_WATCH_STATE["known_files"])
-                tracked_vault = str(_AUTO_WATCH_STATE["vault_path"] or "")
-                _AUTO_WATCH_STATE["vault_path"] = vault_text
-
-            if tracked_vault != vault_text:
-                async with _AUTO_WATCH_LOCK:
-                    _AUTO_WATCH_STATE["known_files"] = current_files
-                continue
-
-            new_files = sorted(current_files - known_files)
-            async with _AUTO_WATCH_LOCK:
-                _AUTO_WATCH_STATE["known_files"] = current_files
-
-            for rel_path in new_files:
-                async with _AUTO_WATCH_LOCK:
-                    if not _AUTO_WATCH_STATE["enabled"]:
-                        break
-                try:
-                    await _handle_auto_watch_file(rel_path)
-                except Exception as exc:  # noqa: BLE001 - watcher should not crash loop
-                    await _set_auto_watch_error(f"{rel_path}: {exc}")
+            await _watch_vault(vault)
         except asyncio.CancelledError:
             break
         except Exception as exc:  # noqa: BLE001 - watcher should not crash loop
@@ -554,6 +756,100 @@ async def _auto_watch_loop() -> None:
             await asyncio.sleep(1.0)
 
 
+async def _watch_vault(vault: Path) -> None:
+    """OS 파일 이벤트(inotify/FSEvents)로 볼트를 감시하다가, 비활성화되거나 볼트가 바뀌면 반환한다."""
+    vault_text = str(vault)
+    async with _AUTO_WATCH_LOCK:
+        tracked_vault = str(_AUTO_WATCH_STATE["vault_path"] or "")
+    if tracked_vault != vault_text:
+        # 새 볼트는 현재 파일들을 기준점으로 삼고, 이후 추가되는 파일만 처리한다.
+        snapshot = _scan_watch_candidates(vault)
+        async with _AUTO_WATCH_LOCK:
+            _AUTO_WATCH_STATE["known_files"] = snapshot
+            _AUTO_WATCH_STATE["vault_path"] = vault_text
+
+    excluded = _watch_excluded_dir_names()
+    stop_event = asyncio.Event()
+    async with _AUTO_WATCH_LOCK:
+        _AUTO_WATCH_STATE["stop_event"] = stop_event
+
+    def _watch_filter(change: Change, path: str) -> bool:
+        if change == Change.modified:
+            return False
+        if _watch_rel_path(vault, path, excluded) is not None:
+            return True
+        # 폴더를 통째로 옮겨/복사해 오면 폴더 하나에 대한 added 이벤트만 오므로 폴더 이벤트도 받는다.
+        if change == Change.added:
+            return os.path.isdir(path) and _watch_rel_dir(vault, path, excluded) is not None
+        return path in _DIR_CACHE
+
+    reconciled = False
+    try:
+        async for changes in awatch(
+            vault,
+            watch_filter=_watch_filter,
+            stop_event=stop_event,
+            rust_timeout=int(AUTO_WATCH_POLL_SEC * 1000),
+            yield_on_timeout=True,
+        ):
+            async with _AUTO_WATCH_LOCK:
+                enabled = bool(_AUTO_WATCH_STATE["enabled"])
+            if not enabled or get_vault_path() != vault:
+                return
+
+            new_files: list[str] = []
+            if not reconciled:
+                # 감시가 시작된 뒤 한 번 스캔 결과와 맞춰, 시드 이후나 재시작/재시도 대기 중처럼
+                # awatch가 돌지 않던 사이에 생기거나 지워진 파일을 반영한다.
+                reconciled = True
+                current = _scan_watch_candidates(vault)
+                async with _AUTO_WATCH_LOCK:
+                    known_files = _AUTO_WATCH_STATE["known_files"]
+                    new_files.extend(current - known_files)
+                    known_files.intersection_update(current)
+                    known_files.update(current)
+
+            added: set[str] = set()
+            deleted: set[str] = set()
+            deleted_dirs: list[str] = []
+            for change, path in changes:
+                rel_path = _watch_rel_path(vault, path, excluded)
+                if rel_path is not None:
+                    if change == Change.added:
+                        added.add(rel_path)
+                    else:
+                        deleted.add(rel_path)
+                elif change == Change.added:
+                    if os.path.isdir(path):
+                        added.update(_scan_iter(path, len(vault_text), excluded))
+                else:
+                    deleted_dirs.append(path)
+
+            # 같은 배치 안의 삭제+생성(에디터의 원자적 저장 등)은 새 파일로 보지 않는다.
+            async with _AUTO_WATCH_LOCK:
+                known_files = _AUTO_WATCH_STATE["known_files"]
+                for rel_path in deleted:
+                    if rel_path not in added:
+                        known_files.discard(rel_path)
+                for dir_path in deleted_dirs:
+                    prefix = dir_path[len(vault_text) + 1:] + os.sep
+                    for rel_path in [f for f in known_files if f.startswith(prefix) and f not in added]:
+                        known_files.discard(rel_path)
+                    _forget_cached_dir(dir_path)
+                for rel_path in added:
+                    if rel_path not in known_files:
+                        known_files.add(rel_path)
+                        new_files.append(rel_path)
+
+            # 처리 완료를 기다리지 않고 태스크만 띄워, 다음 이벤트 배치도 바로 세마포어 대기열에 들어가게 한다.
+            for rel_path in sorted(new_files):
+                _spawn_auto_watch_task(rel_path)
+    finally:
+        async with _AUTO_WATCH_LOCK:
+            if _AUTO_WATCH_STATE.get("stop_event") is stop_event:
+                _AUTO_WATCH_STATE["stop_event"] = None
+
+
 async def start_auto_watch() -> None:
     async with _AUTO_WATCH_LOCK:
         _ensure_auto_watch_task_locked()
@@ -575,6 +871,11 @@ async def stop_auto_watch() -> None:
         task.cancel()
         await asyncio.gather(task, return_exceptions=True)
 
+    pending = list(_AUTO_WATCH_TASKS)
+    for pending_task in pending:
+        pending_task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
 
 class RunBody(BaseModel):
     engine: str = "claude"  # "claude" | "codex"
@@ -606,7 +907,7 @@ async def run_ai(body: RunBody):
     vault = get_vault_path()
     engine = body.engine.lower()
     command = _resolve_command(engine)
-    context = _build_context(vault, body.file_path) if body.file_path else ""
+    context = await asyncio.to_thread(_build_context, vault, body.file_path) if body.file_path else ""
     full_input = _build_input(body.content, body.prompt, context)
     cwd = str(vault)
 
@@ -638,7 +939,7 @@ async def summarize_and_save(body: SummarizeBody):
                     if account:
                         vault = get_vault_path()
                         saved_abs = vault / saved_rel
-                        issue_content = saved_abs.read_text(encoding="utf-8", errors="replace") if saved_abs.exists() else ""
+                        issue_content = await asyncio.to_thread(_read_text_if_exists, saved_abs)
                         if issue_content:
                             issue_md_name = saved_abs.name
                             issue_title = saved_abs.stem
@@ -674,13 +975,13 @@ async def summarize_and_save(body: SummarizeBody):
 async def save_result(body: SaveResultBody):
     vault = get_vault_path()
     try:
-        source_abs = _safe_resolve_in_vault(vault, body.file_path)
+        source_abs = safe_resolve(vault, body.file_path)
         if not source_abs.exists() or not source_abs.is_file():
             raise FileNotFoundError("파일을 찾을 수 없습니다.")
         ai_output = (body.ai_output or "").strip()
         if not ai_output:
             raise HTTPException(status_code=400, detail="저장할 AI 결과가 비어 있습니다.")
-        result = _save_ai_output(vault, body.file_path, source_abs, ai_output)
+        result = await asyncio.to_thread(_save_ai_output, vault, body.file_path, source_abs, ai_output)
 
         if get_nlm_enabled():
             saved_path = result.get("saved_path", "")
@@ -690,7 +991,7 @@ async def save_result(body: SaveResultBody):
                     account = saved_rel.parts[0] if len(saved_rel.parts) > 1 else ""
                     if account:
                         saved_abs = vault / saved_rel
-                        issue_content = saved_abs.read_text(encoding="utf-8", errors="replace") if saved_abs.exists() else ""
+                        issue_content = await asyncio.to_thread(_read_text_if_exists, saved_abs)
                         if issue_content:
                             asyncio.create_task(
                                 _trigger_slide_generation(
@@ -723,7 +1024,7 @@ async def save_result(body: SaveResultBody):
 async def get_auto_watch_status():
     async with _AUTO_WATCH_LOCK:
         _ensure_auto_watch_task_locked()
-        return _auto_watch_status_locked()
+        return json_response(_auto_watch_status_locked())
 
 
 @router.post("/auto-watch")
@@ -736,8 +1037,12 @@ async def set_auto_watch_status(body: AutoWatchBody):
         _AUTO_WATCH_STATE["enabled"] = enabled
         _AUTO_WATCH_STATE["vault_path"] = str(vault) if enabled else ""
         _AUTO_WATCH_STATE["known_files"] = snapshot
+        stop_event = _AUTO_WATCH_STATE.get("stop_event")
+        if stop_event is not None:
+            # 진행 중인 awatch를 깨워 새 설정(비활성화/재시드)으로 다시 시작하게 한다.
+            stop_event.set()
         if enabled:
             _AUTO_WATCH_STATE["last_error"] = ""
             _AUTO_WATCH_STATE["last_error_at"] = ""
         _ensure_auto_watch_task_locked()
-        return _auto_watch_status_locked()
+        return json_response(_auto_watch_status_locked())
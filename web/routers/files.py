@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import mimetypes
 import os
 from pathlib import Path
@@ -7,10 +9,13 @@ from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
 from web.config import get_vault_path, set_vault_path, get_issue_folder, set_issue_folder
+from web.paths import safe_resolve
+from web.responses import json_response
 
 router = APIRouter(prefix="/api")
 
 MAX_UPLOAD_BYTES = 50 * 1024 * 1024  # 50MB
+UPLOAD_CHUNK_BYTES = 1 << 20  # 1MB
 ALLOWED_EXTENSIONS = {".md", ".txt", ".png", ".jpg", ".jpeg", ".gif", ".pdf", ".svg", ".webp"}
 EDITABLE_TEXT_EXTENSIONS = {".md", ".txt"}
 TREE_VISIBLE_EXTENSIONS = {
@@ -30,34 +35,88 @@ SEARCH_EXTENSIONS = {".md", ".txt"}
 
 def _safe_resolve(relative: str) -> Path:
     """Resolve a relative path within the vault and guard against path traversal."""
-    vault = get_vault_path()
-    candidate = (vault / relative).resolve()
-    if not str(candidate).startswith(str(vault)):
-        raise HTTPException(status_code=403, detail="경로 접근이 허용되지 않습니다.")
-    return candidate
-
-
-def _build_tree(path: Path, vault: Path) -> dict:
-    rel = str(path.relative_to(vault))
-    if rel == ".":
-        rel = ""
-    node: dict = {"name": path.name, "path": rel, "type": "directory" if path.is_dir() else "file"}
-    if path.is_dir():
-        children = []
+    try:
+        return safe_resolve(get_vault_path(), relative)
+    except PermissionError as exc:
+        raise HTTPException(status_code=403, detail=str(exc)) from exc
+
+
+# 디렉터리 절대 경로 -> (st_mtime_ns, 정렬된 직속 엔트리 [(name, is_dir)]).
+# mtime이 같으면 scandir/정렬을 건너뛰고, 하위 디렉터리는 각각 mtime으로 다시 검증한다.
+_TREE_CACHE: dict[str, tuple[int, list[tuple[str, bool]]]] = {}
+_TREE_CACHE_KEY: list[str | None] = [None]
+
+
+def _forget_tree_dir(dirpath: str) -> None:
+    """사라진 폴더와 그 하위 폴더의 _TREE_CACHE 항목을 지운다."""
+    cached = _TREE_CACHE.pop(dirpath, None)
+    if cached is not None:
+        for name, is_dir in cached[1]:
+            if is_dir:
+                _forget_tree_dir(os.path.join(dirpath, name))
+
+
+def _list_tree_entries(dirpath: str) -> list[tuple[str, bool]]:
+    mtime_ns = os.stat(dirpath).st_mtime_ns
+    cached = _TREE_CACHE.get(dirpath)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    listing: list[tuple[str, bool]] = []
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(".") or name == "__pycache__":
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                listing.append((name, True))
+                continue
+            _, dot, ext = name.rpartition(".")
+            if dot and f".{ext.lower()}" in TREE_VISIBLE_EXTENSIONS:
+                listing.append((name, False))
+    listing.sort(key=lambda item: (not item[1], item[0].lower()))
+    if cached is not None:
+        current_dirs = {name for name, is_dir in listing if is_dir}
+        for name, is_dir in cached[1]:
+            if is_dir and name not in current_dirs:
+                _forget_tree_dir(os.path.join(dirpath, name))
+    _TREE_CACHE[dirpath] = (mtime_ns, listing)
+    return listing
+
+
+def _build_tree(vault: Path) -> dict:
+    """볼트 전체 트리를 명시적 스택으로 만든다. 상대 경로는 절대 경로 문자열을 잘라서 얻는다."""
+    vault_str = str(vault)
+    vault_len = len(vault_str)
+    if not os.path.isdir(vault_str):
+        return {"name": vault.name, "path": "", "type": "file"}
+
+    if _TREE_CACHE_KEY[0] != vault_str:
+        _TREE_CACHE.clear()
+        _TREE_CACHE_KEY[0] = vault_str
+
+    root: dict = {"name": vault.name, "path": "", "type": "directory", "children": []}
+    stack: list[tuple[str, list]] = [(vault_str, root["children"])]
+    while stack:
+        dirpath, children = stack.pop()
         try:
-            entries = sorted(path.iterdir(), key=lambda p: (p.is_file(), p.name.lower()))
-            for entry in entries:
-                if entry.name.startswith(".") or entry.name == "__pycache__":
-                    continue
-                if entry.is_dir():
-                    children.append(_build_tree(entry, vault))
-                elif entry.suffix.lower() in TREE_VISIBLE_EXTENSIONS:
-                    child_rel = str(entry.relative_to(vault))
-                    children.append({"name": entry.name, "path": child_rel, "type": "file"})
-        except PermissionError:
-            pass
-        node["children"] = children
-    return node
+            listing = _list_tree_entries(dirpath)
+        except OSError:
+            continue
+        for name, is_dir in listing:
+            entry_path = os.path.join(dirpath, name)
+            rel = entry_path[vault_len + 1:]
+            if is_dir:
+                node: dict = {"name": name, "path": rel, "type": "directory", "children": []}
+                children.append(node)
+                stack.append((entry_path, node["children"]))
+            else:
+                children.append({"name": name, "path": rel, "type": "file"})
+    return root
 
 
 def _build_search_snippet(content: str, query: str, radius: int = 70) -> str:
@@ -132,20 +191,20 @@ class SaveFileBody(BaseModel):
 
 
 @router.get("/config")
-def get_config():
+async def get_config():
     vault = get_vault_path()
-    return {"vault_path": str(vault), "issue_folder": get_issue_folder()}
+    return json_response({"vault_path": str(vault), "issue_folder": get_issue_folder()})
 
 
 @router.post("/config")
-def update_config(body: ConfigBody):
+async def update_config(body: ConfigBody):
     if body.vault_path is not None:
         p = Path(body.vault_path).expanduser()
-        if not p.exists():
+        if not await asyncio.to_thread(p.exists):
             raise HTTPException(status_code=400, detail=f"경로가 존재하지 않습니다: {body.vault_path}")
-        if not p.is_dir():
+        if not await asyncio.to_thread(p.is_dir):
             raise HTTPException(status_code=400, detail="폴더 경로를 입력해 주세요.")
-        resolved = set_vault_path(body.vault_path)
+        resolved = await asyncio.to_thread(set_vault_path, body.vault_path)
     else:
         resolved = get_vault_path()
 
@@ -160,7 +219,7 @@ def update_config(body: ConfigBody):
         issue_parts = Path(issue_folder).parts
         if ".." in issue_parts or issue_folder.startswith("."):
             raise HTTPException(status_code=400, detail="Issue 폴더 경로에 '..' 또는 숨김 경로를 사용할 수 없습니다.")
-        normalized_issue = set_issue_folder(issue_folder)
+        normalized_issue = await asyncio.to_thread(set_issue_folder, issue_folder)
     else:
         normalized_issue = get_issue_folder()
 
@@ -170,11 +229,11 @@ def update_config(body: ConfigBody):
 # ── Tree ─────────────────────────────────────────────────────────────────────
 
 @router.get("/tree")
-def get_tree():
+async def get_tree():
     vault = get_vault_path()
     if not vault.exists():
         raise HTTPException(status_code=404, detail=f"볼트 경로를 찾을 수 없습니다: {vault}")
-    return _build_tree(vault, vault)
+    return json_response(await asyncio.to_thread(_build_tree, vault))
 
 
 @router.get("/search")
@@ -195,7 +254,7 @@ def search_vault(q: str = "", limit: int = 60):
 # ── File Read ─────────────────────────────────────────────────────────────────
 
 @router.get("/file")
-def get_file(path: str = ""):
+async def get_file(path: str = ""):
     if not path:
         raise HTTPException(status_code=400, detail="path 파라미터가 필요합니다.")
     target = _safe_resolve(path)
@@ -203,8 +262,8 @@ def get_file(path: str = ""):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
     if not target.is_file():
         raise HTTPException(status_code=400, detail="파일이 아닙니다.")
-    content = target.read_text(encoding="utf-8", errors="replace")
-    return {"path": path, "name": target.name, "content": content}
+    content = await asyncio.to_thread(target.read_text, encoding="utf-8", errors="replace")
+    return json_response({"path": path, "name": target.name, "content": content})
 
 
 @router.post("/file")
@@ -313,15 +372,28 @@ async def upload_file(
     if suffix not in ALLOWED_EXTENSIONS:
         raise HTTPException(status_code=400, detail=f"허용되지 않는 파일 형식입니다: {suffix}")
 
-    data = await file.read()
-    if len(data) > MAX_UPLOAD_BYTES:
-        raise HTTPException(status_code=413, detail="파일 크기가 50MB를 초과합니다.")
-
     dest_dir = _safe_resolve(dest_path) if dest_path else get_vault_path()
     if not dest_dir.is_dir():
         raise HTTPException(status_code=400, detail="저장 경로가 유효한 폴더가 아닙니다.")
 
     save_path = dest_dir / (file.filename or "upload")
-    save_path.write_bytes(data)
+    # 임시 파일에 청크 단위로 쓰고 끝까지 받은 뒤에만 교체해, 용량 초과/중단 시 기존 파일을 보존한다.
+    tmp_path = save_path.with_name(f".{save_path.name}.upload")
+    total = 0
+    fh = await asyncio.to_thread(open, tmp_path, "wb")
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+            total += len(chunk)
+            if total > MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail="파일 크기가 50MB를 초과합니다.")
+            await asyncio.to_thread(fh.write, chunk)
+        await asyncio.to_thread(fh.close)
+        await asyncio.to_thread(os.replace, tmp_path, save_path)
+    except BaseException:
+        fh.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
     vault = get_vault_path()
     return {"saved_path": str(save_path.relative_to(vault)), "name": save_path.name}
@@ -1,4 +1,7 @@
 import asyncio
+import codecs
+import os
+import shlex
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
@@ -6,51 +9,94 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from web.config import get_vault_path
+from web.responses import json_response
 
 router = APIRouter(prefix="/api/git")
 
+STREAM_READ_CHUNK_BYTES = 65536
+SUBPROCESS_STREAM_LIMIT = 1 << 20
+GIT_STREAM_TIMEOUT_SEC = 120
+# sh -c로 묶은 단계의 실패 보고 줄 앞에 붙는 구분 문자(RS). git 출력에는 나오지 않는다.
+_STEP_FAILED_MARK = "\x1e"
 
-def _sse(data: str, event: str = "message") -> str:
-    lines = data.replace("\r\n", "\n").split("\n")
-    payload = "\n".join(f"data: {line}" for line in lines)
-    return f"event: {event}\n{payload}\n\n"
+
+_SSE_EVENT = b"event: "
+_SSE_DATA = b"data: "
+_SSE_NL = b"\n"
+
+
+def _sse(data: str, event: str = "message") -> bytes:
+    out = bytearray(_SSE_EVENT)
+    out += event.encode("utf-8")
+    out += _SSE_NL
+    for line in data.encode("utf-8").replace(b"\r\n", b"\n").split(b"\n"):
+        out += _SSE_DATA
+        out += line
+        out += _SSE_NL
+    out += _SSE_NL
+    return bytes(out)
 
 
 async def _run_git_stream(args: list[str]):
     """Run a git command in the vault directory and stream output as SSE."""
+    async for chunk in _run_vault_stream(["git", *args]):
+        yield chunk
+
+
+async def _run_vault_stream(command: list[str], timeout_sec: int = GIT_STREAM_TIMEOUT_SEC):
     vault = get_vault_path()
     if not vault.exists():
         yield _sse(f"오류: 볼트 경로를 찾을 수 없습니다: {vault}", event="error")
         return
 
-    command = ["git"] + args
     try:
         process = await asyncio.create_subprocess_exec(
             *command,
             cwd=str(vault),
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,  # merge stderr into stdout
+            limit=SUBPROCESS_STREAM_LIMIT,
         )
     except FileNotFoundError:
         yield _sse("오류: git 명령어를 찾을 수 없습니다.", event="error")
         return
 
     async def _pump():
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         while True:
-            line = await process.stdout.readline()
-            if not line:
+            data = await process.stdout.read(STREAM_READ_CHUNK_BYTES)
+            text = decoder.decode(data, final=not data)
+            if text:
+                yield text
+            if not data:
                 break
-            yield line.decode("utf-8", errors="replace")
 
     try:
-        async with asyncio.timeout(120):
-            async for line in _pump():
-                yield _sse(line, event="chunk")
+        async with asyncio.timeout(timeout_sec):
+            pending = ""
+            async for text in _pump():
+                pending += text
+                while pending:
+                    # _step_or_report가 남긴 "RS 메시지\n" 줄은 error 이벤트로 바꿔 프론트에 실패를 알린다.
+                    head, mark, rest = pending.partition(_STEP_FAILED_MARK)
+                    if head:
+                        yield _sse(head, event="chunk")
+                    if not mark:
+                        pending = ""
+                        break
+                    message, newline, tail = rest.partition("\n")
+                    if not newline:
+                        pending = mark + rest  # 보고 줄이 아직 다 오지 않았다.
+                        break
+                    yield _sse(message + "\n", event="error")
+                    pending = tail
+            if pending:
+                yield _sse(pending[len(_STEP_FAILED_MARK):], event="error")
             await process.wait()
     except TimeoutError:
         process.kill()
         await process.wait()
-        yield _sse("오류: git 명령 실행 시간 초과(120초)", event="error")
+        yield _sse(f"오류: git 명령 실행 시간 초과({timeout_sec}초)", event="error")
         return
 
     if process.returncode == 0:
@@ -59,14 +105,11 @@ async def _run_git_stream(args: list[str]):
         yield _sse(f"오류: git 명령 실패 (returncode={process.returncode})", event="error")
 
 
-async def _run_git_stream_step(args: list[str], emit_done: bool = True):
-    async for chunk in _run_git_stream(args):
-        if not emit_done and chunk.startswith("event: done"):
-            continue
-        yield chunk
+# status 같은 읽기 전용 명령이 index.lock을 잡거나 index를 갱신하지 않게 한다.
+_GIT_READ_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
 
 
-async def _run_git_capture(args: list[str]) -> tuple[int, str, str]:
+async def _run_git_capture_raw(args: list[str]) -> tuple[int, bytes, bytes]:
     vault = get_vault_path()
     proc = await asyncio.create_subprocess_exec(
         "git",
@@ -74,15 +117,35 @@ async def _run_git_capture(args: list[str]) -> tuple[int, str, str]:
         cwd=str(vault),
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
+        env=_GIT_READ_ENV,
+        limit=SUBPROCESS_STREAM_LIMIT,
     )
     stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+    return proc.returncode, stdout, stderr
+
+
+async def _run_git_capture(args: list[str]) -> tuple[int, str, str]:
+    code, stdout, stderr = await _run_git_capture_raw(args)
     return (
-        proc.returncode,
+        code,
         stdout.decode("utf-8", errors="replace"),
         stderr.decode("utf-8", errors="replace"),
     )
 
 
+def _format_porcelain_z(raw: bytes) -> str:
+    """`status --porcelain=v1 -z` 출력을 프론트가 기대하는 줄 단위 `XY path` 목록으로 바꾼다."""
+    lines: list[bytes] = []
+    entries = iter(raw.split(b"\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        lines.append(entry)
+        if b"R" in entry[:2] or b"C" in entry[:2]:
+            next(entries, None)  # rename/copy는 원래 경로가 다음 항목으로 따라온다.
+    return b"\n".join(lines).decode("utf-8", errors="replace")
+
+
 def _parse_changed_files(status_text: str) -> list[dict[str, str]]:
     files: list[dict[str, str]] = []
     for line in status_text.splitlines():
@@ -104,17 +167,17 @@ def _parse_changed_files(status_text: str) -> list[dict[str, str]]:
 @router.get("/status")
 async def git_status():
     try:
-        code, stdout, stderr = await _run_git_capture(["status", "--short"])
+        code, stdout, stderr = await _run_git_capture_raw(["status", "--porcelain=v1", "-z"])
         if code != 0:
-            return {"is_git_repo": False, "message": stderr.strip()}
-        return {
+            return json_response({"is_git_repo": False, "message": stderr.decode("utf-8", errors="replace").strip()})
+        return json_response({
             "is_git_repo": True,
-            "status": stdout.strip(),
-        }
+            "status": _format_porcelain_z(stdout),
+        })
     except FileNotFoundError:
-        return {"is_git_repo": False, "message": "git이 설치되어 있지 않습니다."}
+        return json_response({"is_git_repo": False, "message": "git이 설치되어 있지 않습니다."})
     except Exception as e:
-        return {"is_git_repo": False, "message": str(e)}
+        return json_response({"is_git_repo": False, "message": str(e)})
 
 
 @router.get("/changes")
@@ -142,6 +205,10 @@ async def git_pull():
     return StreamingResponse(generator(), media_type="text/event-stream")
 
 
+def _step_or_report(command: str, label: str) -> str:
+    return f'{command} || printf \'\\036%s\\n\' "오류: {label} 실패 (returncode=$?)"'
+
+
 class PushBody(BaseModel):
     message: str = "웹 뷰어에서 업데이트"
     files: list[str] = []
@@ -162,15 +229,18 @@ async def git_push(body: PushBody):
     if not selected_files:
         raise HTTPException(status_code=400, detail="Push할 파일을 1개 이상 선택해 주세요.")
 
+    # add → commit → push를 셸 한 번으로 실행한다. 예전처럼 앞 단계가 실패해도 다음 단계는 계속 진행하고,
+    # 실패한 단계는 출력에 남기며, 최종 성공 여부는 push 결과로 판단한다.
+    quoted_files = " ".join(shlex.quote(path) for path in selected_files)
+    script = "; ".join([
+        _step_or_report(f"git add -- {quoted_files}", "git add"),
+        _step_or_report(f"git commit -m {shlex.quote(commit_msg)}", "git commit"),
+        "git push origin",
+    ])
+
     async def generator():
-        # git add selected files only
-        async for chunk in _run_git_stream_step(["add", "--", *selected_files], emit_done=False):
-            yield chunk
-        # git commit
-        async for chunk in _run_git_stream_step(["commit", "-m", commit_msg], emit_done=False):
-            yield chunk
-        # git push
-        async for chunk in _run_git_stream_step(["push", "origin"]):
+        # 예전에는 단계마다 120초씩 주었으므로 세 단계를 합친 시간만큼 기다린다.
+        async for chunk in _run_vault_stream(["sh", "-c", script], timeout_sec=GIT_STREAM_TIMEOUT_SEC * 3):
             yield chunk
 
     return StreamingResponse(generator(), media_type="text/event-stream")